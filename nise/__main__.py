@@ -92,6 +92,14 @@ def add_aws_parser_args(parser):
                             or \'overwrite\' to finalize the normal report files.
                             """,
     )
+    parser.add_argument(
+        "--aws-compression",
+        metavar="COMPRESSION",
+        dest="aws_compression",
+        choices=["gzip", "zstd"],
+        required=False,
+        help="Compression for reports placed in the S3 bucket. zstd requires the zstandard package.",
+    )
 
 
 def add_azure_parser_args(parser):
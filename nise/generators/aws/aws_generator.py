@@ -15,9 +15,12 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Defines the abstract generator."""
-import datetime
+import os
+import string
 from abc import abstractmethod
+from itertools import repeat
 from random import choice
+from random import choices
 from random import randint
 
 from nise.generators.generator import AbstractGenerator
@@ -168,6 +171,16 @@ RESERVE_COLS = (
 class AWSGenerator(AbstractGenerator):
     """Defines a abstract class for generators."""
 
+    __slots__ = (
+        "payer_account",
+        "usage_accounts",
+        "attributes",
+        "_tags",
+        "num_instances",
+        "_empty_row",
+        "_bill_cache",
+    )
+
     RESOURCE_TAG_COLS = {
         "resourceTags/user:environment",
         "resourceTags/user:app",
@@ -230,6 +243,8 @@ class AWSGenerator(AbstractGenerator):
         ("AWS GovCloud (US-East)", "us-gov-east-1", "us-gov-east-1a", "USGE1-EBS"),
         ("AWS GovCloud (US)", "us-gov-west-1", "us-gov-west-1a", "USGW1-EBS"),
     )
+    # Whether _update_data places rows in a location, and so needs one drawn per hour.
+    HAS_LOCATION = True
 
     def __init__(self, start_date, end_date, payer_account, usage_accounts, attributes=None, tag_cols=None):
         """Initialize the generator."""
@@ -241,14 +256,37 @@ class AWSGenerator(AbstractGenerator):
         if tag_cols:
             self.RESOURCE_TAG_COLS.update(tag_cols)
             self.AWS_COLUMNS.update(tag_cols)
+        self._empty_row = dict.fromkeys(self.AWS_COLUMNS, "")
+        self._bill_cache = {}
         super().__init__(start_date, end_date)
 
+    def _set_hours(self):
+        """Create a list of hours with their precomputed time interval strings."""
+        hours = super()._set_hours()
+        if hours:
+            bounds = [hour.get("start") for hour in hours]
+            bounds.append(hours[-1].get("end"))
+            # Hours advance in whole hour steps, so minutes and seconds never change
+            # and the date part only changes once every 24 bounds.
+            suffix = f":{self.start_date.minute:02d}:{self.start_date.second:02d}Z"
+            stamps = []
+            day = prefix = None
+            for bound in bounds:
+                if bound.day != day:
+                    day = bound.day
+                    prefix = f"{bound.year:04d}-{bound.month:02d}-{day:02d}T"
+                stamps.append(f"{prefix}{bound.hour:02d}{suffix}")
+            for hour, start_str, end_str in zip(hours, stamps, stamps[1:]):
+                hour["interval"] = f"{start_str}/{end_str}"
+        return hours
+
     @staticmethod
     def timestamp(in_date):
         """Provide timestamp for a date."""
-        if not (in_date and isinstance(in_date, datetime.datetime)):
-            raise ValueError("in_date must be a date object.")
-        return in_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return (
+            f"{in_date.year:04d}-{in_date.month:02d}-{in_date.day:02d}"
+            f"T{in_date.hour:02d}:{in_date.minute:02d}:{in_date.second:02d}Z"
+        )
 
     @staticmethod
     def time_interval(start, end):
@@ -267,49 +305,45 @@ class AWSGenerator(AbstractGenerator):
             tags = choice(options)
         return tags
 
-    def _init_data_row(self, start, end, **kwargs):  # noqa: C901
-        """Create a row of data with placeholder for all headers."""
-        if not (start and end):
-            raise ValueError("start and end must be date objects.")
-        if not isinstance(start, datetime.datetime):
-            raise ValueError("start must be a date object.")
-        if not isinstance(end, datetime.datetime):
-            raise ValueError("end must be a date object.")
-
-        bill_begin = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
-        bill_end = AbstractGenerator.next_month(bill_begin)
-        row = {}
-        COL_MAP = {
-            "identity/LineItemId": self.fake.sha1(raw_output=False),
-            "identity/TimeInterval": AWSGenerator.time_interval(start, end),
-            "bill/BillingEntity": "AWS",
-            "bill/BillType": "Anniversary",
-            "bill/PayerAccountId": self.payer_account,
-            "bill/BillingPeriodStartDate": AWSGenerator.timestamp(bill_begin),
-            "bill/BillingPeriodEndDate": AWSGenerator.timestamp(bill_end),
-        }
-        for column in self.AWS_COLUMNS:
-            row[column] = ""
-            if COL_MAP.get(column):
-                row[column] = COL_MAP.get(column)
+    def _get_bill_period(self, start):
+        """Return the formatted billing period bounds for the month of start."""
+        key = (start.year, start.month)
+        bill_period = self._bill_cache.get(key)
+        if bill_period is None:
+            bill_begin = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+            bill_end = AbstractGenerator.next_month(bill_begin)
+            bill_period = (AWSGenerator.timestamp(bill_begin), AWSGenerator.timestamp(bill_end))
+            self._bill_cache[key] = bill_period
+        return bill_period
 
+    def _init_data_row(self, start, end, **kwargs):
+        """Create a row of data with placeholder for all headers."""
+        bill_period = self._get_bill_period(start)
+        row = self._empty_row.copy()
+        row["identity/LineItemId"] = kwargs.get("line_item_id") or self.fake.sha1(raw_output=False)
+        row["identity/TimeInterval"] = kwargs.get("interval") or AWSGenerator.time_interval(start, end)
+        row["bill/BillingEntity"] = "AWS"
+        row["bill/BillType"] = "Anniversary"
+        row["bill/PayerAccountId"] = self.payer_account
+        row["bill/BillingPeriodStartDate"], row["bill/BillingPeriodEndDate"] = bill_period
         return row
 
-    def _get_location(self):
-        """Pick instance location."""
-        options = None
+    def _get_location_options(self):
+        """Collect the locations an instance can be placed in."""
         if self.attributes and self.attributes.get("region"):
             region = self.attributes.get("region")
             options = [option for option in self.REGIONS if region in option]
-        if options:
-            location = choice(options)
-        else:
-            location = choice(self.REGIONS)
-        return location
+            if options:
+                return options
+        return self.REGIONS
+
+    def _get_location(self):
+        """Pick instance location."""
+        return choice(self._get_location_options())
 
     def _add_common_usage_info(self, row, start, end, **kwargs):
         """Add common usage information."""
-        row["lineItem/UsageAccountId"] = choice(self.usage_accounts)
+        row["lineItem/UsageAccountId"] = kwargs.get("usage_account") or choice(self.usage_accounts)
         row["lineItem/LineItemType"] = "Usage"
         row["lineItem/UsageStartDate"] = start
         row["lineItem/UsageEndDate"] = end
@@ -329,6 +363,11 @@ class AWSGenerator(AbstractGenerator):
                     row[tag_key] = self.fake.word()
                     seen_tags.update([tag_key])
 
+    @staticmethod
+    def _generate_product_sku():
+        """Generate a random 12 character product sku."""
+        return "".join(choices(string.ascii_uppercase, k=12))
+
     def _generate_region_short_code(self, region):
         """Generate the AWS short code for a region."""
         split_region = region.split("-")
@@ -340,11 +379,20 @@ class AWSGenerator(AbstractGenerator):
 
     def _generate_hourly_data(self, **kwargs):
         """Create hourly data."""
-        for hour in self.hours:
+        num_hours = len(self.hours)
+        usage_accounts = choices(self.usage_accounts, k=num_hours)
+        if self.HAS_LOCATION:
+            locations = choices(self._get_location_options(), k=num_hours)
+        else:
+            locations = repeat(None)
+        # Line item ids are opaque sha1-sized hex strings, so one urandom call
+        # split into 20 byte groups replaces a Faker sha1 per row.
+        line_item_ids = os.urandom(20 * num_hours).hex(" ", 20).split()
+        for hour, usage_account, location, line_item_id in zip(self.hours, usage_accounts, locations, line_item_ids):
             start = hour.get("start")
             end = hour.get("end")
-            row = self._init_data_row(start, end)
-            row = self._update_data(row, start, end)
+            row = self._init_data_row(start, end, interval=hour.get("interval"), line_item_id=line_item_id)
+            self._update_data(row, start, end, usage_account=usage_account, location=location)
             yield row
 
     @abstractmethod
@@ -54,9 +54,9 @@ class DataTransferGenerator(AWSGenerator):
             if attributes.get("tags"):
                 self._tags = attributes.get("tags")
 
-    def _get_data_transfer(self, rate):
+    def _get_data_transfer(self, rate, location=None):
         """Get data transfer info."""
-        location1, aws_region, _, storage_region1 = self._get_location()
+        location1, aws_region, _, storage_region1 = location or self._get_location()
         location2, _, _, storage_region2 = self._get_location()
         trans_desc, operation, trans_type = choice(self.DATA_TRANSFER)
         trans_desc = trans_desc.format(storage_region1, storage_region2)
@@ -68,19 +68,19 @@ class DataTransferGenerator(AWSGenerator):
         if self._product_sku:
             sku = self._product_sku
         else:
-            sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
+            sku = self._generate_product_sku()
         return sku
 
     def _update_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
-        row = self._add_common_usage_info(row, start, end)
+        row = self._add_common_usage_info(row, start, end, **kwargs)
 
         resource_id = self._resource_id if self._resource_id else self.fake.ean8()
         rate = self._rate if self._rate else round(uniform(0.12, 0.19), 3)
         amount = self._amount if self._amount else uniform(0.000002, 0.09)
         cost = amount * rate
         trans_desc, operation, description, location1, location2, trans_type, aws_region = self._get_data_transfer(
-            rate
+            rate, kwargs.get("location")
         )
 
         row["lineItem/ProductCode"] = self._product_code
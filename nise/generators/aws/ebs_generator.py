@@ -35,7 +35,7 @@ class EBSGenerator(AWSGenerator):
         self._resource_id = "vol-{}".format(self.fake.ean8())
         self._amount = uniform(0.2, 300.99)
         self._rate = round(uniform(0.02, 0.16), 3)
-        self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
+        self._product_sku = self._generate_product_sku()
 
         if self.attributes:
             if self.attributes.get("resource_id"):
@@ -48,6 +48,9 @@ class EBSGenerator(AWSGenerator):
                 self._product_sku = self.attributes.get("product_sku")
             if self.attributes.get("tags"):
                 self._tags = self.attributes.get("tags")
+        self._amount_str = str(self._amount)
+        self._rate_str = str(self._rate)
+        self._cost_str = str(self._amount * self._rate)
 
     def _get_storage(self):
         """Get storage data."""
@@ -55,25 +58,22 @@ class EBSGenerator(AWSGenerator):
 
     def _update_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
-        row = self._add_common_usage_info(row, start, end)
+        row = self._add_common_usage_info(row, start, end, **kwargs)
 
-        rate = self._rate
-        amount = self._amount
-        cost = amount * rate
-        location, aws_region, _, storage_region = self._get_location()
-        description = f"${rate} per GB-Month of snapshot data stored - {location}"
+        location, aws_region, _, storage_region = kwargs.get("location") or self._get_location()
+        description = f"${self._rate} per GB-Month of snapshot data stored - {location}"
         burst, max_iops, max_thru, max_vol_size, vol_backed, vol_type = self._get_storage()
 
         row["lineItem/ProductCode"] = "AmazonEC2"
         row["lineItem/UsageType"] = f"{storage_region}:VolumeUsage"
         row["lineItem/Operation"] = "CreateVolume"
         row["lineItem/ResourceId"] = self._resource_id
-        row["lineItem/UsageAmount"] = str(amount)
+        row["lineItem/UsageAmount"] = self._amount_str
         row["lineItem/CurrencyCode"] = "USD"
-        row["lineItem/UnblendedRate"] = str(rate)
-        row["lineItem/UnblendedCost"] = str(cost)
-        row["lineItem/BlendedRate"] = str(rate)
-        row["lineItem/BlendedCost"] = str(cost)
+        row["lineItem/UnblendedRate"] = self._rate_str
+        row["lineItem/UnblendedCost"] = self._cost_str
+        row["lineItem/BlendedRate"] = self._rate_str
+        row["lineItem/BlendedCost"] = self._cost_str
         row["lineItem/LineItemDescription"] = description
         row["product/ProductName"] = "Amazon Elastic Compute Cloud"
         row["product/location"] = location
@@ -89,8 +89,8 @@ class EBSGenerator(AWSGenerator):
         row["product/storageMedia"] = vol_backed
         row["product/usagetype"] = f"{storage_region}:VolumeUsage"
         row["product/volumeType"] = vol_type
-        row["pricing/publicOnDemandCost"] = str(cost)
-        row["pricing/publicOnDemandRate"] = str(rate)
+        row["pricing/publicOnDemandCost"] = self._cost_str
+        row["pricing/publicOnDemandRate"] = self._rate_str
         row["pricing/term"] = "OnDemand"
         row["pricing/unit"] = "GB-Mo"
         self._add_tag_data(row)
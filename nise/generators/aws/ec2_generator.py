@@ -73,7 +73,7 @@ class EC2Generator(AWSGenerator):
         super().__init__(start_date, end_date, payer_account, usage_accounts, attributes, tag_cols)
         self._processor_arch = choice(self.ARCHS)
         self._resource_id = "i-{}".format(self.fake.ean8())
-        self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
+        self._product_sku = self._generate_product_sku()
         self._instance_type = choice(self.INSTANCE_TYPES)
         if self.attributes:
             if self.attributes.get("processor_arch"):
@@ -101,8 +101,8 @@ class EC2Generator(AWSGenerator):
         """Update data with generator specific data."""
         inst_type, vcpu, memory, storage, family, cost, rate, description = self._instance_type
         inst_description = description.format(cost, inst_type)
-        location, aws_region, avail_zone, _ = self._get_location()
-        row = self._add_common_usage_info(row, start, end)
+        location, aws_region, avail_zone, _ = kwargs.get("location") or self._get_location()
+        row = self._add_common_usage_info(row, start, end, **kwargs)
 
         row["lineItem/ProductCode"] = "AmazonEC2"
         row["lineItem/UsageType"] = f"BoxUsage:{inst_type}"
@@ -72,7 +72,7 @@ class RDSGenerator(AWSGenerator):
         """Initialize the RDS generator."""
         super().__init__(start_date, end_date, payer_account, usage_accounts, attributes, tag_cols)
         self._processor_arch = choice(self.ARCHS)
-        self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
+        self._product_sku = self._generate_product_sku()
         self._instance_type = choice(self.INSTANCE_TYPES)
         self._resource_id = "i-{}".format(self.fake.ean8())
         if self.attributes:
@@ -103,8 +103,8 @@ class RDSGenerator(AWSGenerator):
         """Update data with generator specific data."""
         inst_type, vcpu, memory, storage, family, cost, rate, description = self._instance_type
         inst_description = description.format(cost, inst_type)
-        location, aws_region, avail_zone, _ = self._get_location()
-        row = self._add_common_usage_info(row, start, end)
+        location, aws_region, avail_zone, _ = kwargs.get("location") or self._get_location()
+        row = self._add_common_usage_info(row, start, end, **kwargs)
         # split_region = aws_region.split('-')
         # region_short_code = aws_region[0:2].upper() + split_region[1][0].upper() + split_region[2]
         region_short_code = self._generate_region_short_code(aws_region)
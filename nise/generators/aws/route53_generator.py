@@ -29,10 +29,12 @@ ROUTE_53_PRODUCTS = list(ROUTE_53_PRODUCTS_DICT.values())
 class Route53Generator(AWSGenerator):
     """Generator for Route53 data."""
 
+    HAS_LOCATION = False
+
     def __init__(self, start_date, end_date, payer_account, usage_accounts, attributes=None, tag_cols=None):
         """Initialize the Route53 generator."""
         super().__init__(start_date, end_date, payer_account, usage_accounts, attributes, tag_cols)
-        self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
+        self._product_sku = self._generate_product_sku()
         self._product_family = None
         self._resource_id = self.fake.ean8()
         self._rate = None
@@ -68,7 +70,7 @@ class Route53Generator(AWSGenerator):
         operation = self.fake.pystr(min_chars=1, max_chars=6).upper()
         if usage_type == "HostedZone":
             operation = usage_type
-        row = self._add_common_usage_info(row, start, end)
+        row = self._add_common_usage_info(row, start, end, **kwargs)
 
         row["lineItem/ProductCode"] = "AmazonRoute53"
         row["lineItem/UsageType"] = usage_type
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for s3 data generation."""
+from random import choice
 from random import uniform
 
 from nise.generators.aws.aws_generator import AWSGenerator
@@ -23,12 +24,24 @@ from nise.generators.aws.aws_generator import AWSGenerator
 class S3Generator(AWSGenerator):
     """Generator for S3 data."""
 
+    __slots__ = (
+        "_amount",
+        "_rate",
+        "_product_sku",
+        "_resource_id",
+        "_amount_str",
+        "_rate_str",
+        "_cost_str",
+        "_descriptions",
+        "_const_fields",
+    )
+
     def __init__(self, start_date, end_date, payer_account, usage_accounts, attributes=None, tag_cols=None):
         """Initialize the S3 generator."""
         super().__init__(start_date, end_date, payer_account, usage_accounts, attributes, tag_cols)
         self._amount = uniform(0.2, 6000.99)
         self._rate = round(uniform(0.02, 0.06), 3)
-        self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
+        self._product_sku = self._generate_product_sku()
         self._resource_id = self.fake.ean8()
         if self.attributes:
             if self.attributes.get("amount"):
@@ -41,6 +54,36 @@ class S3Generator(AWSGenerator):
                 self._resource_id = self.attributes.get("resource_id")
             if self.attributes.get("tags"):
                 self._tags = self.attributes.get("tags")
+        self._amount_str = str(self._amount)
+        self._rate_str = str(self._rate)
+        self._cost_str = str(self._amount * self._rate)
+        self._descriptions = {
+            location: f"${self._rate} per GB-Month of snapshot data stored - {location}"
+            for location, _, _, _ in self.REGIONS
+        }
+        self._const_fields = {
+            "lineItem/LineItemType": "Usage",
+            "lineItem/ProductCode": "AmazonS3",
+            "lineItem/UsageType": "Requests-Tier2",
+            "lineItem/Operation": "GetObject",
+            "lineItem/UsageAmount": self._amount_str,
+            "lineItem/CurrencyCode": "USD",
+            "lineItem/UnblendedRate": self._rate_str,
+            "lineItem/UnblendedCost": self._cost_str,
+            "lineItem/BlendedRate": self._rate_str,
+            "lineItem/BlendedCost": self._cost_str,
+            "product/ProductName": "Amazon Simple Storage Service",
+            "product/locationType": "AWS Region",
+            "product/productFamily": "Storage Snapshot",
+            "product/servicecode": "AmazonS3",
+            "product/sku": self._product_sku,
+            "product/storageMedia": "Amazon S3",
+            "product/usagetype": "Requests-Tier2",
+            "pricing/publicOnDemandCost": self._cost_str,
+            "pricing/publicOnDemandRate": self._rate_str,
+            "pricing/term": "OnDemand",
+            "pricing/unit": "GB-Mo",
+        }
 
     def _get_arn(self, avail_zone):
         """Create an amazon resource name."""
@@ -48,39 +91,16 @@ class S3Generator(AWSGenerator):
 
     def _update_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
-        row = self._add_common_usage_info(row, start, end)
-
-        rate = self._rate
-        amount = self._amount
-        cost = amount * rate
-        location, aws_region, avail_zone, _ = self._get_location()
-        description = f"${rate} per GB-Month of snapshot data stored - {location}"
-        amazon_resource_name = self._get_arn(avail_zone)
+        location, aws_region, avail_zone, _ = kwargs.get("location") or self._get_location()
 
-        row["lineItem/ProductCode"] = "AmazonS3"
-        row["lineItem/UsageType"] = "Requests-Tier2"
-        row["lineItem/Operation"] = "GetObject"
-        row["lineItem/ResourceId"] = amazon_resource_name
-        row["lineItem/UsageAmount"] = str(amount)
-        row["lineItem/CurrencyCode"] = "USD"
-        row["lineItem/UnblendedRate"] = str(rate)
-        row["lineItem/UnblendedCost"] = str(cost)
-        row["lineItem/BlendedRate"] = str(rate)
-        row["lineItem/BlendedCost"] = str(cost)
-        row["lineItem/LineItemDescription"] = description
-        row["product/ProductName"] = "Amazon Simple Storage Service"
+        row.update(self._const_fields)
+        row["lineItem/UsageAccountId"] = kwargs.get("usage_account") or choice(self.usage_accounts)
+        row["lineItem/UsageStartDate"] = start
+        row["lineItem/UsageEndDate"] = end
+        row["lineItem/ResourceId"] = self._get_arn(avail_zone)
+        row["lineItem/LineItemDescription"] = self._descriptions[location]
         row["product/location"] = location
-        row["product/locationType"] = "AWS Region"
-        row["product/productFamily"] = "Storage Snapshot"
         row["product/region"] = aws_region
-        row["product/servicecode"] = "AmazonS3"
-        row["product/sku"] = self._product_sku
-        row["product/storageMedia"] = "Amazon S3"
-        row["product/usagetype"] = "Requests-Tier2"
-        row["pricing/publicOnDemandCost"] = str(cost)
-        row["pricing/publicOnDemandRate"] = str(rate)
-        row["pricing/term"] = "OnDemand"
-        row["pricing/unit"] = "GB-Mo"
         self._add_tag_data(row)
 
         return row
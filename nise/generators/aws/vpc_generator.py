@@ -25,7 +25,7 @@ class VPCGenerator(AWSGenerator):
         """Initialize the VPC generator."""
         super().__init__(start_date, end_date, payer_account, usage_accounts, attributes, tag_cols)
         self._resource_id = "vpn-{}".format(self.fake.ean8())
-        self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
+        self._product_sku = self._generate_product_sku()
         self._rate = None
         self._cost = None
         if self.attributes:
@@ -46,8 +46,8 @@ class VPCGenerator(AWSGenerator):
         default_rate = 0.05
         rate = float(self._rate) if self._rate else default_rate
         cost = float(self._cost) if self._cost else default_cost
-        location, aws_region, avail_zone, _ = self._get_location()
-        row = self._add_common_usage_info(row, start, end)
+        location, aws_region, avail_zone, _ = kwargs.get("location") or self._get_location()
+        row = self._add_common_usage_info(row, start, end, **kwargs)
         region_short_code = self._generate_region_short_code(aws_region)
         usage_type = f"{region_short_code}-VPN-Usage-Hours:ipsec.1"
 
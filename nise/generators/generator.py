@@ -23,22 +23,33 @@ from faker import Faker
 
 REPORT_TYPE = "report_type"
 
+_FAKER = None
+
+
+def get_faker():
+    """Return the Faker instance shared by all generators."""
+    global _FAKER
+    if _FAKER is None:
+        _FAKER = Faker()
+    return _FAKER
+
 
 class AbstractGenerator(ABC):
     """Defines a abstract class for generators."""
 
+    __slots__ = ("start_date", "end_date", "hours", "days", "fake")
+
     def __init__(self, start_date, end_date):
         """Initialize the generator."""
         self.start_date = start_date
         self.end_date = end_date
         self.hours = self._set_hours()
         self.days = self._set_days()
-        self.fake = Faker()
+        self.fake = get_faker()
         super().__init__()
 
     def _set_hours(self):
         """Create a list of hours between the start and end dates for hourly aws data."""
-        hours = []
         if not self.start_date or not self.end_date:
             raise ValueError("start_date and end_date must be date objects.")
         if not isinstance(self.start_date, datetime.datetime):
@@ -49,12 +60,9 @@ class AbstractGenerator(ABC):
             raise ValueError("start_date must be a date object less than end_date.")
 
         one_hour = datetime.timedelta(minutes=60)
-        cur_date = self.start_date
-        while (cur_date + one_hour) <= self.end_date:
-            cur_hours = {"start": cur_date, "end": cur_date + one_hour}
-            hours.append(cur_hours)
-            cur_date = cur_date + one_hour
-        return hours
+        num_hours = (self.end_date - self.start_date) // one_hour
+        starts = [self.start_date + one_hour * i for i in range(num_hours + 1)]
+        return [{"start": start, "end": end} for start, end in zip(starts, starts[1:])]
 
     def _set_days(self):
         """Create a list of days between the start and end dates for daily azure data."""
@@ -79,10 +87,9 @@ class AbstractGenerator(ABC):
     @staticmethod
     def next_month(in_date):
         """Return the first of the next month from the in_date."""
-        dt_first = in_date.replace(day=1)
-        dt_up_month = dt_first + datetime.timedelta(days=32)
-        dt_next_month = dt_up_month.replace(day=1)
-        return dt_next_month
+        if in_date.month == 12:
+            return in_date.replace(year=in_date.year + 1, month=1, day=1)
+        return in_date.replace(month=in_date.month + 1, day=1)
 
     @abstractmethod
     def _init_data_row(self, start, end, **kwargs):
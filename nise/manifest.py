@@ -25,6 +25,8 @@ from dateutil.relativedelta import relativedelta
 TEMPLATE_DIR = os.path.dirname(__file__)
 AWS_TEMPLATE_FILE = "aws-template-manifest.json"
 OCP_TEMPLATE_FILE = "ocp-template-manifest.json"
+# Maps the --aws-compression choice to the manifest compression value and report key extension.
+AWS_COMPRESSION_TYPES = {"gzip": ("GZIP", ".gz"), "zstd": ("ZSTD", ".zst")}
 
 
 def _manifest_datetime_str(date_time):
@@ -75,13 +77,14 @@ def aws_generate_manifest(fake, template_data):
     report_id = fake.sha256(raw_output=False)
     prefix_name = template_data.get("aws_prefix_name")
     file_names = template_data.get("file_names")
+    compression, extension = AWS_COMPRESSION_TYPES[template_data.get("aws_compression") or "gzip"]
     report_keys = []
     for file_name in file_names:
         file_base_name = os.path.basename(file_name)
         if prefix_name:
-            report_key = f"{prefix_name}/{report_name}/{range_str}" f"/{assembly_id}/{file_base_name}.gz"
+            report_key = f"{prefix_name}/{report_name}/{range_str}" f"/{assembly_id}/{file_base_name}{extension}"
         else:
-            report_key = f"/{report_name}/{range_str}/{assembly_id}/{file_base_name}.gz"
+            report_key = f"/{report_name}/{range_str}/{assembly_id}/{file_base_name}{extension}"
         report_keys.append(report_key)
 
     render_data = {
@@ -90,7 +93,7 @@ def aws_generate_manifest(fake, template_data):
         "billing_period_start": _manifest_datetime_str(bp_start),
         "billing_period_end": _manifest_datetime_str(bp_end),
         "report_key": json.dumps(report_keys),
-        "compression": "GZIP",
+        "compression": compression,
         "bucket": template_data.get("aws_bucket_name"),
     }
     render_data.update(template_data)
@@ -17,17 +17,22 @@
 """Module responsible for generating the cost and usage report."""
 import base64
 import calendar
-import copy
 import csv
 import gzip
-import importlib
 import json
+import mmap
 import os
-import random
 import shutil
-import string
+import subprocess
 import tarfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.util import find_spec
+from itertools import chain
+from itertools import islice
+from itertools import repeat
+from operator import itemgetter
 from random import randint
 from tempfile import gettempdir
 from tempfile import NamedTemporaryFile
@@ -64,12 +69,10 @@ from nise.generators.gcp import JSONLGCPDatabaseGenerator
 from nise.generators.gcp import JSONLGCPNetworkGenerator
 from nise.generators.gcp import JSONLProjectGenerator
 from nise.generators.gcp import ProjectGenerator
-from nise.generators.ocp import OCP_NAMESPACE_LABEL
-from nise.generators.ocp import OCP_NODE_LABEL
-from nise.generators.ocp import OCP_POD_USAGE
+from nise.generators.generator import get_faker
 from nise.generators.ocp import OCP_REPORT_TYPE_TO_COLS
-from nise.generators.ocp import OCP_STORAGE_USAGE
 from nise.generators.ocp import OCPGenerator
+from nise.manifest import AWS_COMPRESSION_TYPES
 from nise.manifest import aws_generate_manifest
 from nise.manifest import ocp_generate_manifest
 from nise.upload import gcp_bucket_to_dataset
@@ -77,30 +80,110 @@ from nise.upload import upload_to_azure_container
 from nise.upload import upload_to_gcp_storage
 from nise.upload import upload_to_s3
 from nise.util import LOG
+from requests.adapters import HTTPAdapter
+
+
+_GENERATORS = {
+    generator_cls.__name__: generator_cls
+    for generator_cls in (
+        DataTransferGenerator,
+        EBSGenerator,
+        EC2Generator,
+        RDSGenerator,
+        Route53Generator,
+        S3Generator,
+        VPCGenerator,
+        BandwidthGenerator,
+        SQLGenerator,
+        StorageGenerator,
+        VMGenerator,
+        VNGenerator,
+        CloudStorageGenerator,
+        ComputeEngineGenerator,
+        GCPDatabaseGenerator,
+        GCPNetworkGenerator,
+        ProjectGenerator,
+        JSONLCloudStorageGenerator,
+        JSONLComputeEngineGenerator,
+        JSONLGCPDatabaseGenerator,
+        JSONLGCPNetworkGenerator,
+        JSONLProjectGenerator,
+        OCPGenerator,
+    )
+}
+_MONTH_NAMES = list(calendar.month_name)
+_monthrange = calendar.monthrange
+
+# Reuse connections across the per-file insights uploads.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 
 def create_temporary_copy(path, temp_file_name, temp_dir_name="None"):
     """Create temporary copy of a file."""
     temp_dir = gettempdir()
     if temp_dir_name:
-        new_dir = os.path.join(temp_dir, temp_dir_name)
-        if not os.path.exists(new_dir):
-            os.mkdir(new_dir)
-        temp_path = os.path.join(new_dir, temp_file_name)
-    else:
-        temp_path = os.path.join(temp_dir, temp_file_name)
-    shutil.copy2(path, temp_path)
+        temp_dir = os.path.join(temp_dir, temp_dir_name)
+        os.makedirs(temp_dir, exist_ok=True)
+    temp_path = os.path.join(temp_dir, temp_file_name)
+    # The copy is only staged for tarring, so a hard link is as good as a copy.
+    # Drop any leftover file first so it is replaced rather than written through.
+    if os.path.lexists(temp_path):
+        os.remove(temp_path)
+    try:
+        os.link(path, temp_path)
+    except OSError:
+        # Hard links need both paths on the same filesystem.
+        shutil.copy2(path, temp_path)
     return temp_path
 
 
+def _csv_rows(data, header):
+    """Yield row values in header order, using "" for any missing column.
+
+    Like csv.DictWriter, a row with a key that is not in the header raises ValueError.
+    """
+    header = list(header)
+    columns = set(header)
+    if len(header) == 1:
+        # itemgetter returns a bare value rather than a tuple for a single key.
+        column = header[0]
+
+        def get_values(row):
+            return (row[column],)
+
+    else:
+        get_values = itemgetter(*header)
+    for row in data:
+        # A row holding exactly the header's keys needs no further checks.
+        if len(row) == len(columns):
+            try:
+                yield get_values(row)
+                continue
+            except KeyError:
+                pass
+        extra_keys = row.keys() - columns
+        if extra_keys:
+            raise ValueError("dict contains fields not in fieldnames: " + ", ".join(map(repr, extra_keys)))
+        yield [row.get(column, "") for column in header]
+
+
 def _write_csv(output_file, data, header):
     """Output csv file data."""
     LOG.info(f"Writing to {output_file.split('/')[-1]}")
     with open(output_file, "w") as file:
-        writer = csv.DictWriter(file, fieldnames=header)
-        writer.writeheader()
-        for row in data:
-            writer.writerow(row)
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(_csv_rows(data, header))
+
+
+def _write_csv_gz(output_file, data, header, compresslevel=6):
+    """Output csv file data directly into a gzip file."""
+    LOG.info(f"Writing to {output_file.split('/')[-1]}")
+    with gzip.open(output_file, "wt", compresslevel=compresslevel, newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(_csv_rows(data, header))
 
 
 def _write_jsonl(output_file, data):
@@ -137,19 +220,71 @@ def _generate_azure_date_range(month):
     return start.strftime("%Y%m%d") + "-" + end.strftime("%Y%m%d")
 
 
+def _find_gzip_command():
+    """Find an external gzip compatible compressor, preferring the parallel pigz."""
+    for command in ("pigz", "gzip"):
+        command_path = shutil.which(command)
+        if command_path:
+            return command_path
+    return None
+
+
+GZIP_CHUNK_SIZE = 1024 * 1024
+
+
 def _gzip_report(report_path):
     """Compress the report."""
     t_file = NamedTemporaryFile(mode="wb", suffix=".csv.gz", delete=False)
-    with open(report_path, "rb") as f_in, gzip.open(t_file.name, "wb") as f_out:
-        f_out.write(f_in.read())
+    gzip_command = _find_gzip_command()
+    if gzip_command:
+        try:
+            with t_file:
+                subprocess.run([gzip_command, "-6", "-c", report_path], stdout=t_file, check=True)
+        except subprocess.CalledProcessError:
+            os.remove(t_file.name)
+            raise
+        return t_file.name
+
+    with open(report_path, "rb") as f_in, t_file, gzip.GzipFile(fileobj=t_file, mode="wb", compresslevel=6) as f_out:
+        # mmap cannot map an empty file, and an empty report needs nothing written.
+        if os.fstat(f_in.fileno()).st_size:
+            # Compress straight out of the page cache instead of read() copies.
+            with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as report, memoryview(report) as view:
+                for start in range(0, len(view), GZIP_CHUNK_SIZE):
+                    end = start + GZIP_CHUNK_SIZE
+                    f_out.write(view[start:end])
     return t_file.name
 
 
+def _zstd_report(report_path):
+    """Compress the report with multi-threaded zstandard."""
+    # zstandard is an optional dependency only needed for zstd output.
+    import zstandard
+
+    t_file = NamedTemporaryFile(mode="wb", suffix=".csv.zst", delete=False)
+    compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+    with open(report_path, "rb") as f_in, compressor.stream_writer(t_file) as f_out:
+        shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
+    return t_file.name
+
+
+AWS_REPORT_COMPRESSORS = {"gzip": _gzip_report, "zstd": _zstd_report}
+
+
 def _tar_gzip_report(temp_dir):
     """Compress the report and manifest to tarfile."""
     t_file = NamedTemporaryFile(mode="w", suffix=".tar.gz", delete=False)
-
-    with tarfile.open(t_file.name, "w:gz") as tar:
+    gzip_command = _find_gzip_command()
+    if gzip_command:
+        # Stream an uncompressed tar into the external compressor instead of deflating in Python.
+        with t_file, subprocess.Popen([gzip_command, "-6"], stdin=subprocess.PIPE, stdout=t_file) as compress:
+            with tarfile.open(fileobj=compress.stdin, mode="w|") as tar:
+                tar.add(temp_dir, arcname=os.path.sep)
+        if compress.returncode:
+            raise subprocess.CalledProcessError(compress.returncode, compress.args)
+        return t_file.name
+
+    with tarfile.open(t_file.name, "w:gz", compresslevel=6) as tar:
         tar.add(temp_dir, arcname=os.path.sep)
 
     return t_file.name
@@ -235,6 +370,7 @@ def post_payload_to_ingest_service(insights_upload, local_path):
     insights_org_id = os.environ.get("INSIGHTS_ORG_ID")
     insights_user = os.environ.get("INSIGHTS_USER")
     insights_password = os.environ.get("INSIGHTS_PASSWORD")
+    insights_verify_ssl = os.environ.get("INSIGHTS_VERIFY_SSL", "false").lower() == "true"
     content_type = "application/vnd.redhat.hccm.tar+tgz"
     if os.path.isfile(local_path):
         file_info = os.stat(local_path)
@@ -250,65 +386,103 @@ def post_payload_to_ingest_service(insights_upload, local_path):
                 }
             }
             headers = {"x-rh-identity": base64.b64encode(json.dumps(header).encode("UTF-8"))}
-            return requests.post(
+            return _SESSION.post(
                 insights_upload,
                 data={},
                 files={"file": ("payload.tar.gz", upload_file, content_type)},
                 headers=headers,
             )
 
-        return requests.post(
+        return _SESSION.post(
             insights_upload,
             data={},
             files={"file": ("payload.tar.gz", upload_file, content_type)},
             auth=(insights_user, insights_password),
-            verify=False,
+            verify=insights_verify_ssl,
         )
 
 
 def _create_month_list(start_date, end_date):
     """Create a list of months given the date range args."""
     months = []
-    current = start_date.replace(day=1)
-    while current <= end_date:
+    year, month_number = start_date.year, start_date.month
+    first_month = (year, month_number)
+    last_month = (end_date.year, end_date.month)
+    while (year, month_number) <= last_month:
         month = {
-            "name": calendar.month_name[current.month],
-            "start": datetime(year=current.year, month=current.month, day=1),
-            "end": datetime(
-                year=current.year,
-                month=current.month,
-                day=calendar.monthrange(year=current.year, month=current.month)[1],
-                hour=23,
-                minute=59,
-            ),
+            "name": _MONTH_NAMES[month_number],
+            "start": datetime(year=year, month=month_number, day=1),
+            "end": datetime(year=year, month=month_number, day=_monthrange(year, month_number)[1], hour=23, minute=59),
         }
-        if current.month == start_date.month:
+        if (year, month_number) == first_month:
             # First month start with start_date
             month["start"] = start_date
-        if current.month == end_date.month:
+        if (year, month_number) == last_month:
             # Last month ends with end_date
             month["end"] = end_date.replace(hour=23, minute=59)
 
         months.append(month)
-        current += relativedelta(months=+1)
+        month_number += 1
+        if month_number == 13:
+            month_number = 1
+            year += 1
 
     return months
 
 
-def _aws_finalize_report(data, static_data=None):
-    """Populate invoice id for data."""
-    data = copy.deepcopy(data)
+def _write_report_files(rows, row_limit, write_file):
+    """Write rows with write_file(file_number, rows), starting a new file every row_limit rows."""
+    file_names = []
+    file_number = 0
+    if row_limit:
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, row_limit))
+            if len(chunk) < row_limit:
+                rows = chunk
+                break
+            file_number += 1
+            file_names.append(write_file(file_number, chunk))
+        if file_number != 0:
+            file_number += 1
+    file_names.append(write_file(file_number, rows))
+    return file_names
+
 
+def _aws_invoice_id(static_data=None):
+    """Get the invoice id for a finalized report."""
     invoice_id = None
     if static_data and static_data.get("finalized_report"):
         invoice_id = static_data.get("finalized_report").get("invoice_id")
 
     if not invoice_id:
-        invoice_id = "".join([random.choice(string.digits) for _ in range(9)])
-    for row in data:
-        row["bill/InvoiceId"] = invoice_id
+        invoice_id = f"{randint(0, 10**9 - 1):09d}"
+    return invoice_id
+
+
+def _inject_invoice(row, invoice_id):
+    """Set the invoice id on a row."""
+    row["bill/InvoiceId"] = invoice_id
+    return row
+
+
+def _aws_finalize_report(data, static_data=None):
+    """Return a copy of data with the invoice id populated."""
+    invoice_id = _aws_invoice_id(static_data)
+    # Row values are immutable scalars, so a shallow copy of each row is enough.
+    return [{**row, "bill/InvoiceId": invoice_id} for row in data]
 
-    return data
+
+def _aws_generator_rows(month_generators):
+    """Lazily yield the rows of every (generator, num_instances) pair for a month."""
+    num_gens = len(month_generators)
+    ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
+    for count, (gen, num_instances) in enumerate(month_generators):
+        for _ in range(num_instances):
+            yield from gen.generate_data()
+
+        if count % ten_percent == 0:
+            LOG.info(f"Done with {count} of {num_gens} generators.")
 
 
 def _generate_accounts(static_report_data=None):
@@ -317,21 +491,15 @@ def _generate_accounts(static_report_data=None):
         payer_account = static_report_data.get("payer")
         usage_accounts = tuple(static_report_data.get("user"))
     else:
-        fake = Faker()
-        payer_account = fake.ean(length=13)
-        usage_accounts = (
-            payer_account,
-            fake.ean(length=13),
-            fake.ean(length=13),
-            fake.ean(length=13),
-            fake.ean(length=13),
-        )
+        ean = get_faker().ean
+        payer_account = ean(length=13)
+        usage_accounts = (payer_account, ean(length=13), ean(length=13), ean(length=13), ean(length=13))
     return payer_account, usage_accounts
 
 
 def _generate_azure_account_info(static_report_data=None):
     """Return Azure subscription, billing, and usage account info."""
-    fake = Faker()
+    fake = get_faker()
     company_name = fake.company()
     company_email = company_name.replace(" ", "").replace(",", "")
     email_suffix = f"@{company_email}.com"
@@ -380,7 +548,7 @@ def _get_generators(generator_list):
     if generator_list:
         for item in generator_list:
             for generator_cls, attributes in item.items():
-                generator_obj = {"generator": getattr(importlib.import_module(__name__), generator_cls)}
+                generator_obj = {"generator": _GENERATORS[generator_cls]}
                 if attributes.get("start_date"):
                     attributes["start_date"] = parser.parse(attributes.get("start_date"))
                 if attributes.get("end_date"):
@@ -396,7 +564,7 @@ def _get_jsonl_generators(generator_list):
     if generator_list:
         for item in generator_list:
             for generator_cls, attributes in item.items():
-                generator_obj = {"generator": getattr(importlib.import_module(__name__), "JSONL" + generator_cls)}
+                generator_obj = {"generator": _GENERATORS["JSONL" + generator_cls]}
                 if attributes.get("start_date"):
                     attributes["start_date"] = parser.parse(attributes.get("start_date"))
                 if attributes.get("end_date"):
@@ -443,9 +611,21 @@ def _create_generator_dates_from_yaml(attributes, month):
 
 
 def write_aws_file(
-    file_number, aws_report_name, month_name, year, data, aws_finalize_report, static_report_data, headers
+    file_number,
+    aws_report_name,
+    month_name,
+    year,
+    data,
+    aws_finalize_report,
+    static_report_data,
+    headers,
+    compress=False,
 ):
-    """Write AWS data to a file."""
+    """Write AWS data to a file.
+
+    When compress is set the report is written straight to "<file>.csv.gz"
+    instead of a plain csv. The path of the file written is returned.
+    """
     headers = sorted(list(headers))
     if file_number != 0:
         file_name = "{}-{}-{}-{}".format(month_name, year, aws_report_name, str(file_number))
@@ -453,8 +633,11 @@ def write_aws_file(
         file_name = f"{month_name}-{year}-{aws_report_name}"
 
     if aws_finalize_report and aws_finalize_report == "overwrite":
-        data = _aws_finalize_report(data, static_report_data)
+        invoice_id = _aws_invoice_id(static_report_data)
+        data = (_inject_invoice(row, invoice_id) for row in data)
     elif aws_finalize_report and aws_finalize_report == "copy":
+        # Both files are written from the same rows, so materialize them once.
+        data = list(data)
         # Currently only a local option as this does not simulate
         finalized_data = _aws_finalize_report(data, static_report_data)
         file_name_finalized = f"{file_name}-finalized"
@@ -462,18 +645,135 @@ def write_aws_file(
         _write_csv(full_file_name, finalized_data, headers)
 
     full_file_name = "{}/{}.csv".format(os.getcwd(), file_name)
-    _write_csv(full_file_name, data, headers)
+    if compress:
+        full_file_name = f"{full_file_name}.gz"
+        _write_csv_gz(full_file_name, data, headers)
+    else:
+        _write_csv(full_file_name, data, headers)
 
     return full_file_name
 
 
-def aws_create_report(options):  # noqa: C901
+def _seed_month_worker():
+    """Reseed Faker, whose random state a forked worker would otherwise share with its siblings."""
+    Faker.seed()
+
+
+def _process_months(process_month, months, *args):
+    """Run process_month(month, *args) for every month, in worker processes when several can run at once."""
+    max_workers = min(len(months), os.cpu_count() or 1)
+    if max_workers < 2:
+        for month in months:
+            process_month(month, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_seed_month_worker) as executor:
+        # Consume the results so a failure in any month is raised here.
+        list(executor.map(process_month, months, *(repeat(arg) for arg in args)))
+
+
+def _aws_create_month_report(month, options, generators, payer_account, usage_accounts):  # noqa: C901
+    """Create, and optionally upload, the cost usage report files for one month."""
+    aws_finalize_report = options.get("aws_finalize_report")
+    static_report_data = options.get("static_report_data")
+    aws_bucket_name = options.get("aws_bucket_name")
+    aws_report_name = options.get("aws_report_name")
+    write_monthly = options.get("write_monthly", False)
+    aws_compression = options.get("aws_compression") or "gzip"
+    compress_report = AWS_REPORT_COMPRESSORS[aws_compression]
+    report_extension = AWS_COMPRESSION_TYPES[aws_compression][1]
+    # Without a local copy to keep, gzip reports are written compressed in a single pass.
+    stream_gzip = bool(aws_bucket_name) and aws_compression == "gzip" and not write_monthly
+    LOG.info(f"Producing data for {len(generators)} generators for {month.get('start').strftime('%Y-%m')}.")
+    month_generators = []
+    for generator in generators:
+        generator_cls = generator.get("generator")
+        attributes = generator.get("attributes")
+        gen_start_date = month.get("start")
+        gen_end_date = month.get("end")
+        if attributes:
+            # Skip if generator usage is outside of current month
+            if attributes.get("end_date") < month.get("start"):
+                continue
+            if attributes.get("start_date") > month.get("end"):
+                continue
+
+            gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
+
+        gen = generator_cls(
+            gen_start_date, gen_end_date, payer_account, usage_accounts, attributes, options.get("aws_tags")
+        )
+        num_instances = 1 if attributes else randint(2, 60)
+        month_generators.append((gen, num_instances))
+
+    # Every generator is built before any rows are written so the header includes all tag columns.
+    # The columns live on the shared class, so a month without an active generator still gets a header.
+    headers = generators[0].get("generator").AWS_COLUMNS
+    year = month.get("start").year
+    written_files = _write_report_files(
+        _aws_generator_rows(month_generators),
+        options.get("row_limit"),
+        lambda file_number, rows: write_aws_file(
+            file_number,
+            aws_report_name,
+            month.get("name"),
+            year,
+            rows,
+            aws_finalize_report,
+            static_report_data,
+            headers,
+            compress=stream_gzip,
+        ),
+    )
+    # Streamed reports are listed, and uploaded, under the name of the csv they hold.
+    monthly_files = [os.path.splitext(file_name)[0] for file_name in written_files] if stream_gzip else written_files
+
+    if aws_bucket_name:
+        manifest_values = {"account": payer_account}
+        manifest_values.update(options)
+        manifest_values["start_date"] = gen_start_date
+        manifest_values["end_date"] = gen_end_date
+        manifest_values["file_names"] = monthly_files
+        s3_cur_path, manifest_data = aws_generate_manifest(get_faker(), manifest_values)
+        s3_month_path = os.path.dirname(s3_cur_path)
+        s3_month_manifest_path = s3_month_path + "/" + aws_report_name + "-Manifest.json"
+        s3_assembly_manifest_path = s3_cur_path + "/" + aws_report_name + "-Manifest.json"
+
+        temp_manifest = _write_manifest(manifest_data)
+
+        routes = [(s3_month_manifest_path, temp_manifest), (s3_assembly_manifest_path, temp_manifest)]
+        if stream_gzip:
+            temp_cur_zips = written_files
+        else:
+            # Compression already uses every core, so it runs here and the threads below only wait on uploads.
+            temp_cur_zips = [compress_report(monthly_file) for monthly_file in monthly_files]
+        routes += [
+            ("{}/{}{}".format(s3_cur_path, os.path.basename(monthly_file), report_extension), temp_cur_zip)
+            for monthly_file, temp_cur_zip in zip(monthly_files, temp_cur_zips)
+        ]
+
+        # The uploads are independent, so run them side by side instead of one after another.
+        with ThreadPoolExecutor(max_workers=min(8, len(routes))) as executor:
+            futures = [
+                executor.submit(aws_route_file, aws_bucket_name, destination_file, local_path)
+                for destination_file, local_path in routes
+            ]
+            for future in futures:
+                future.result()
+        os.remove(temp_manifest)
+        _remove_files(temp_cur_zips)
+    if not write_monthly and not stream_gzip:
+        _remove_files(monthly_files)
+
+
+def aws_create_report(options):
     """Create a cost usage report file."""
-    data = []
     start_date = options.get("start_date")
     end_date = options.get("end_date")
-    aws_finalize_report = options.get("aws_finalize_report")
     static_report_data = options.get("static_report_data")
+    # Reports are only compressed for a bucket; fail before generating any data rather than in a month worker.
+    if options.get("aws_bucket_name") and options.get("aws_compression") == "zstd" and find_spec("zstandard") is None:
+        raise ImportError("zstd compression requires the zstandard package: pip install koku-nise[zstd]")
 
     if static_report_data:
         generators = _get_generators(static_report_data.get("generators"))
@@ -493,94 +793,7 @@ def aws_create_report(options):  # noqa: C901
     months = _create_month_list(start_date, end_date)
 
     payer_account, usage_accounts = _generate_accounts(accounts_list)
-
-    aws_bucket_name = options.get("aws_bucket_name")
-    aws_report_name = options.get("aws_report_name")
-    write_monthly = options.get("write_monthly", False)
-    for month in months:
-        data = []
-        file_number = 0
-        monthly_files = []
-        fake = Faker()
-        num_gens = len(generators)
-        ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
-        LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
-        for count, generator in enumerate(generators):
-            generator_cls = generator.get("generator")
-            attributes = generator.get("attributes")
-            gen_start_date = month.get("start")
-            gen_end_date = month.get("end")
-            if attributes:
-                # Skip if generator usage is outside of current month
-                if attributes.get("end_date") < month.get("start"):
-                    continue
-                if attributes.get("start_date") > month.get("end"):
-                    continue
-
-                gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
-
-            gen = generator_cls(
-                gen_start_date, gen_end_date, payer_account, usage_accounts, attributes, options.get("aws_tags")
-            )
-            num_instances = 1 if attributes else randint(2, 60)
-            for _ in range(num_instances):
-                for hour in gen.generate_data():
-                    data += [hour]
-                    if len(data) == options.get("row_limit"):
-                        file_number += 1
-                        month_output_file = write_aws_file(
-                            file_number,
-                            aws_report_name,
-                            month.get("name"),
-                            gen_start_date.year,
-                            data,
-                            aws_finalize_report,
-                            static_report_data,
-                            gen.AWS_COLUMNS,
-                        )
-                        monthly_files.append(month_output_file)
-                        data.clear()
-
-            if count % ten_percent == 0:
-                LOG.info(f"Done with {count} of {num_gens} generators.")
-
-        if file_number != 0:
-            file_number += 1
-        month_output_file = write_aws_file(
-            file_number,
-            aws_report_name,
-            month.get("name"),
-            gen_start_date.year,
-            data,
-            aws_finalize_report,
-            static_report_data,
-            gen.AWS_COLUMNS,
-        )
-        monthly_files.append(month_output_file)
-
-        if aws_bucket_name:
-            manifest_values = {"account": payer_account}
-            manifest_values.update(options)
-            manifest_values["start_date"] = gen_start_date
-            manifest_values["end_date"] = gen_end_date
-            manifest_values["file_names"] = monthly_files
-            s3_cur_path, manifest_data = aws_generate_manifest(fake, manifest_values)
-            s3_month_path = os.path.dirname(s3_cur_path)
-            s3_month_manifest_path = s3_month_path + "/" + aws_report_name + "-Manifest.json"
-            s3_assembly_manifest_path = s3_cur_path + "/" + aws_report_name + "-Manifest.json"
-
-            temp_manifest = _write_manifest(manifest_data)
-            aws_route_file(aws_bucket_name, s3_month_manifest_path, temp_manifest)
-            aws_route_file(aws_bucket_name, s3_assembly_manifest_path, temp_manifest)
-
-            for monthly_file in monthly_files:
-                temp_cur_zip = _gzip_report(monthly_file)
-                destination_file = "{}/{}.gz".format(s3_cur_path, os.path.basename(monthly_file))
-                aws_route_file(aws_bucket_name, destination_file, temp_cur_zip)
-                os.remove(temp_cur_zip)
-            os.remove(temp_manifest)
-        if not write_monthly:
-            _remove_files(monthly_files)
+    _process_months(_aws_create_month_report, months, options, generators, payer_account, usage_accounts)
 
 
 def azure_create_report(options):  # noqa: C901
@@ -687,11 +900,88 @@ def write_ocp_file(file_number, cluster_id, month_name, year, report_type, data)
     return full_file_name
 
 
-def ocp_create_report(options):  # noqa: C901
+def _ocp_create_month_report(month, options, generators):  # noqa: C901
+    """Create, and optionally upload, the usage report files for one month."""
+    cluster_id = options.get("ocp_cluster_id")
+    insights_upload = options.get("insights_upload")
+    write_monthly = options.get("write_monthly", False)
+    monthly_files = []
+    month_generators = []
+    for generator in generators:
+        generator_cls = generator.get("generator")
+        attributes = generator.get("attributes")
+        gen_start_date = month.get("start")
+        gen_end_date = month.get("end")
+        if attributes:
+            # Skip if generator usage is outside of current month
+            if attributes.get("end_date") < month.get("start"):
+                continue
+            if attributes.get("start_date") > month.get("end"):
+                continue
+
+            gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
+
+        month_generators.append(generator_cls(gen_start_date, gen_end_date, attributes))
+
+    year = month.get("start").year
+    # Every report type is written, even for a month without an active generator.
+    for report_type in OCP_REPORT_TYPE_TO_COLS:
+        LOG.info(f"Generating data for {report_type} for {month.get('name')}")
+        rows = chain.from_iterable(gen.generate_data(report_type) for gen in month_generators)
+        monthly_files += _write_report_files(
+            rows,
+            options.get("row_limit"),
+            lambda file_number, rows: write_ocp_file(
+                file_number, cluster_id, month.get("name"), year, report_type, rows
+            ),
+        )
+
+    if insights_upload:
+        # Generate manifest for all files
+        ocp_assembly_id = uuid4()
+        # Months may be processed concurrently, so each stages its payload in its own directory.
+        payload_dir = f"payload-{ocp_assembly_id}"
+        report_datetime = gen_start_date
+        temp_files = {}
+        for num_file in range(len(monthly_files)):
+            temp_filename = f"{ocp_assembly_id}_openshift_report.{num_file}.csv"
+            temp_usage_file = create_temporary_copy(monthly_files[num_file], temp_filename, payload_dir)
+            temp_files[temp_filename] = temp_usage_file
+
+        manifest_file_names = ", ".join(f'"{w}"' for w in temp_files)
+        manifest_values = {
+            "ocp_cluster_id": cluster_id,
+            "ocp_assembly_id": ocp_assembly_id,
+            "report_datetime": report_datetime,
+            "files": manifest_file_names[1:-1],
+            "start": gen_start_date,
+            "end": gen_end_date,
+            "version": __version__,
+        }
+        manifest_data = ocp_generate_manifest(manifest_values)
+        temp_manifest = _write_manifest(manifest_data)
+        temp_manifest_name = create_temporary_copy(temp_manifest, "manifest.json", payload_dir)
+
+        # Tarball and upload files individually
+        for temp_usage_file in temp_files.values():
+            report_files = [temp_usage_file, temp_manifest_name]
+            temp_usage_zip = _tar_gzip_report_files(report_files)
+            ocp_route_file(insights_upload, temp_usage_zip)
+            os.remove(temp_usage_file)
+            os.remove(temp_usage_zip)
+
+        os.remove(temp_manifest)
+        os.remove(temp_manifest_name)
+        os.rmdir(os.path.dirname(temp_manifest_name))
+    if not write_monthly:
+        LOG.info("Cleaning up local directory")
+        _remove_files(monthly_files)
+
+
+def ocp_create_report(options):
     """Create a usage report file."""
     start_date = options.get("start_date")
     end_date = options.get("end_date")
-    cluster_id = options.get("ocp_cluster_id")
     static_report_data = options.get("static_report_data")
     if static_report_data:
         generators = _get_generators(static_report_data.get("generators"))
@@ -699,95 +989,7 @@ def ocp_create_report(options):  # noqa: C901
         generators = [{"generator": OCPGenerator, "attributes": None}]
 
     months = _create_month_list(start_date, end_date)
-    insights_upload = options.get("insights_upload")
-    write_monthly = options.get("write_monthly", False)
-    for month in months:
-        data = {OCP_POD_USAGE: [], OCP_STORAGE_USAGE: [], OCP_NODE_LABEL: [], OCP_NAMESPACE_LABEL: []}
-        file_numbers = {OCP_POD_USAGE: 0, OCP_STORAGE_USAGE: 0, OCP_NODE_LABEL: 0, OCP_NAMESPACE_LABEL: 0}
-        monthly_files = []
-        for generator in generators:
-            generator_cls = generator.get("generator")
-            attributes = generator.get("attributes")
-            gen_start_date = month.get("start")
-            gen_end_date = month.get("end")
-            if attributes:
-                # Skip if generator usage is outside of current month
-                if attributes.get("end_date") < month.get("start"):
-                    continue
-                if attributes.get("start_date") > month.get("end"):
-                    continue
-
-                gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
-
-            gen = generator_cls(gen_start_date, gen_end_date, attributes)
-            for report_type in gen.ocp_report_generation.keys():
-                LOG.info(f"Generating data for {report_type} for {month.get('name')}")
-                for hour in gen.generate_data(report_type):
-                    data[report_type] += [hour]
-                    if len(data[report_type]) == options.get("row_limit"):
-                        file_numbers[report_type] += 1
-                        month_output_file = write_ocp_file(
-                            file_numbers[report_type],
-                            cluster_id,
-                            month.get("name"),
-                            gen_start_date.year,
-                            report_type,
-                            data[report_type],
-                        )
-                        monthly_files.append(month_output_file)
-                        data[report_type].clear()
-
-        for report_type in gen.ocp_report_generation.keys():
-            if file_numbers[report_type] != 0:
-                file_numbers[report_type] += 1
-
-            month_output_file = write_ocp_file(
-                file_numbers[report_type],
-                cluster_id,
-                month.get("name"),
-                gen_start_date.year,
-                report_type,
-                data[report_type],
-            )
-            monthly_files.append(month_output_file)
-
-        if insights_upload:
-            # Generate manifest for all files
-            ocp_assembly_id = uuid4()
-            report_datetime = gen_start_date
-            temp_files = {}
-            for num_file in range(len(monthly_files)):
-                temp_filename = f"{ocp_assembly_id}_openshift_report.{num_file}.csv"
-                temp_usage_file = create_temporary_copy(monthly_files[num_file], temp_filename, "payload")
-                temp_files[temp_filename] = temp_usage_file
-
-            manifest_file_names = ", ".join(f'"{w}"' for w in temp_files)
-            manifest_values = {
-                "ocp_cluster_id": cluster_id,
-                "ocp_assembly_id": ocp_assembly_id,
-                "report_datetime": report_datetime,
-                "files": manifest_file_names[1:-1],
-                "start": gen_start_date,
-                "end": gen_end_date,
-                "version": __version__,
-            }
-            manifest_data = ocp_generate_manifest(manifest_values)
-            temp_manifest = _write_manifest(manifest_data)
-            temp_manifest_name = create_temporary_copy(temp_manifest, "manifest.json", "payload")
-
-            # Tarball and upload files individually
-            for temp_usage_file in temp_files.values():
-                report_files = [temp_usage_file, temp_manifest_name]
-                temp_usage_zip = _tar_gzip_report_files(report_files)
-                ocp_route_file(insights_upload, temp_usage_zip)
-                os.remove(temp_usage_file)
-                os.remove(temp_usage_zip)
-
-            os.remove(temp_manifest)
-            os.remove(temp_manifest_name)
-        if not write_monthly:
-            LOG.info("Cleaning up local directory")
-            _remove_files(monthly_files)
+    _process_months(_ocp_create_month_report, months, options, generators)
 
 
 def write_gcp_file(start_date, end_date, data, options):
@@ -826,7 +1028,6 @@ def write_gcp_file_jsonl(start_date, end_date, data, options):
 
 def gcp_create_report(options):  # noqa: C901
     """Create a GCP cost usage report file."""
-    fake = Faker()
     gcp_bucket_name = options.get("gcp_bucket_name")
     gcp_dataset_name = options.get("gcp_dataset_name")
     gcp_table_name = options.get("gcp_table_name")
@@ -874,7 +1075,7 @@ def gcp_create_report(options):  # noqa: C901
                 {"generator": JSONLGCPNetworkGenerator, "attributes": None},
                 {"generator": JSONLGCPDatabaseGenerator, "attributes": None},
             ]
-            account = fake.word()
+            account = get_faker().word()
             project_generator = JSONLProjectGenerator(account)
             projects = project_generator.generate_projects()
 
@@ -889,7 +1090,7 @@ def gcp_create_report(options):  # noqa: C901
             {"generator": GCPNetworkGenerator, "attributes": None},
             {"generator": GCPDatabaseGenerator, "attributes": None},
         ]
-        account = fake.word()
+        account = get_faker().word()
 
         project_generator = ProjectGenerator(account)
         projects = project_generator.generate_projects()
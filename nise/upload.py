@@ -21,6 +21,7 @@ import traceback
 
 import boto3
 from azure.storage.blob import BlobServiceClient
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from google.cloud import bigquery
 from google.cloud import storage
@@ -30,6 +31,9 @@ from msrestazure.azure_exceptions import CloudError
 from nise.util import LOG
 from requests.exceptions import ConnectionError as BotoConnectionError
 
+# Upload large reports in parallel multipart chunks.
+S3_TRANSFER_CONFIG = TransferConfig(max_concurrency=8, multipart_threshold=8 * 1024 * 1024)
+
 
 def upload_to_s3(bucket_name, bucket_file_path, local_path):
     """Upload data to an S3 bucket.
@@ -44,8 +48,9 @@ def upload_to_s3(bucket_name, bucket_file_path, local_path):
     """
     uploaded = True
     try:
-        s3_client = boto3.resource("s3")
-        s3_client.Bucket(bucket_name).upload_file(local_path, bucket_file_path)
+        # A session per call, since uploads may run on several threads and sessions are not thread safe.
+        s3_client = boto3.session.Session().resource("s3")
+        s3_client.Bucket(bucket_name).upload_file(local_path, bucket_file_path, Config=S3_TRANSFER_CONFIG)
         msg = f"Uploaded {bucket_file_path} to s3 bucket {bucket_name}."
         LOG.info(msg)
     except (ClientError, BotoConnectionError, boto3.exceptions.S3UploadFailedError) as upload_err:
@@ -36,6 +36,8 @@ ACCTS_STR = {
     "vmachine": ("Microsoft.Compute", "virtualMachines"),
     "vnetwork": ("Microsoft.Network", "publicIPAddresses"),
 }
+ACCTS_STR_CHOICES = tuple(ACCTS_STR.values())
+INSTANCE_ID_POOL_SIZE = 32
 RESOURCE_LOCATIONS = [
     "US East",
     "US North Central",
@@ -45,6 +47,14 @@ RESOURCE_LOCATIONS = [
     "US Central",
     "US West",
 ]
+# (generator key, log label) for each generator type built by AzureGenerator.build_data
+GENERATOR_TYPES = (
+    ("bandwidth", "Bandwidth"),
+    ("sql", "SQL"),
+    ("storage", "Storage"),
+    ("vmachine", "Virtual Machine"),
+    ("vnetwork", "Virtual Network"),
+)
 TAG_KEYS = {
     "bandwidth": ["environment", "version", "app"],
     "sql": ["environment", "version", "app"],
@@ -62,24 +72,26 @@ def generate_instance_id(key, config, node_name=None):
     if ACCTS_STR.get(key):
         consumed, second_part = ACCTS_STR.get(key)
     else:
-        consumed, second_part = random.choice(list(ACCTS_STR.values()))
+        consumed, second_part = random.choice(ACCTS_STR_CHOICES)
     resource_type = consumed + "/" + second_part
     accts_str = "/providers/" + resource_type + "/"
     return f"subscriptions/{config.payer_account}/resourceGroups/{resource_group}/{accts_str[1:-2]}/{resource_name}"
 
 
-def generate_tags_and_instance_id(key, config, prefix="", suffix="", dynamic=True):
+def generate_tags_and_instance_id(key, config, prefix="", suffix="", dynamic=True, instance_id=None):
     """Generate properly formatted Azure tags and instance_id.
 
     Args:
         config.id_labels = {(resource_id, node_name): tags} or None
+        instance_id = an instance_id to reuse when config.id_labels is not set
     Returns:
         tags (list), instance_id (str)
     """
     if not config.get("id_labels"):
         keys = TAG_KEYS.get(key)
         tags = [dicta(key=key, v=generate_name(config)) for key in keys]
-        instance_id = generate_instance_id(key, config)
+        if not instance_id:
+            instance_id = generate_instance_id(key, config)
     else:
         id_label_key = random.choice(list(config.id_labels.keys()))
         tag_key_list = random.choice(config.id_labels.get(id_label_key))
@@ -94,18 +106,26 @@ def generate_tags_and_instance_id(key, config, prefix="", suffix="", dynamic=Tru
     return tags, instance_id
 
 
-def generate_azure_dicta(config, key):
-    """Return dicta with common attributes."""
-    tags, instance_id = generate_tags_and_instance_id(key, config)
+def generate_azure_dicta(config, key, start_date=None, end_date=None, instance_id=None, shared=None):
+    """Return dicta with common attributes.
+
+    start_date and end_date default to the config dates as strings.
+    shared is an earlier generator whose instance_id, resource_location and tags are reused.
+    """
+    if shared:
+        tags, instance_id, resource_location = shared.tags, shared.instance_id, shared.resource_location
+    else:
+        tags, instance_id = generate_tags_and_instance_id(key, config, instance_id=instance_id)
+        resource_location = random.choice(RESOURCE_LOCATIONS)
     rate = round(random.uniform(0.1, 0.50), 5)
     usage = round(random.uniform(0.01, 1), 5)
 
     return dicta(
-        start_date=str(config.start_date),
-        end_date=str(config.end_date),
+        start_date=start_date or str(config.start_date),
+        end_date=end_date or str(config.end_date),
         instance_id=instance_id,
         meter_id=str(uuid4()),
-        resource_location=random.choice(RESOURCE_LOCATIONS),
+        resource_location=resource_location,
         usage_quantity=usage,
         resource_rate=rate,
         pre_tax_cost=usage * rate,
@@ -129,46 +149,39 @@ class AzureGenerator(Generator):
 
         return config
 
-    def build_data(self, config, _random=False):  # noqa: C901
+    def build_data(self, config, _random=False):
         """
 
         """
         LOG.info("Data build starting")
 
-        data = dicta(
-            payer=config.payer_account,
-            bandwidth_gens=[],
-            sql_gens=[],
-            storage_gens=[],
-            vmachine_gens=[],
-            vnetwork_gens=[],
-        )
-
-        max_bandwidth_gens = FAKER.random_int(0, config.max_bandwidth_gens) if _random else config.max_bandwidth_gens
-        max_sql_gens = FAKER.random_int(0, config.max_sql_gens) if _random else config.max_sql_gens
-        max_storage_gens = FAKER.random_int(0, config.max_storage_gens) if _random else config.max_storage_gens
-        max_vmachine_gens = FAKER.random_int(0, config.max_vmachine_gens) if _random else config.max_vmachine_gens
-        max_vnetwork_gens = FAKER.random_int(0, config.max_vnetwork_gens) if _random else config.max_vnetwork_gens
-
-        LOG.info(f"Building {max_bandwidth_gens} Bandwidth generators ...")
-        for _ in range(max_bandwidth_gens):
-            data.bandwidth_gens.append(generate_azure_dicta(config, "bandwidth"))
-
-        LOG.info(f"Building {max_sql_gens} SQL generators ...")
-        for _ in range(max_sql_gens):
-            data.sql_gens.append(generate_azure_dicta(config, "sql"))
-
-        LOG.info(f"Building {max_storage_gens} Storage generators ...")
-        for _ in range(max_storage_gens):
-            data.storage_gens.append(generate_azure_dicta(config, "storage"))
-
-        LOG.info(f"Building {max_vmachine_gens} Virtual Machine generators ...")
-        for _ in range(max_vmachine_gens):
-            data.vmachine_gens.append(generate_azure_dicta(config, "vmachine"))
-
-        LOG.info(f"Building {max_vnetwork_gens} Virtual Network generators ...")
-        for _ in range(max_vnetwork_gens):
-            data.vnetwork_gens.append(generate_azure_dicta(config, "vnetwork"))
+        data = dicta(payer=config.payer_account)
+
+        # Format the dates once rather than for every generator.
+        start_date = str(config.start_date)
+        end_date = str(config.end_date)
+
+        for key, label in GENERATOR_TYPES:
+            max_gens = config[f"max_{key}_gens"]
+            if _random:
+                max_gens = FAKER.random_int(0, max_gens)
+            LOG.info(f"Building {max_gens} {label} generators ...")
+            if config.get("id_labels"):
+                # instance ids follow the OCP node of the chosen labels
+                gens = [generate_azure_dicta(config, key, start_date, end_date) for _ in range(max_gens)]
+            else:
+                # Past INSTANCE_ID_POOL_SIZE generators, instances are shared rather than all unique.
+                # A shared instance keeps the location and tags of its first generator.
+                pool_size = min(max_gens, INSTANCE_ID_POOL_SIZE)
+                gens = [
+                    generate_azure_dicta(config, key, start_date, end_date, generate_instance_id(key, config))
+                    for _ in range(pool_size)
+                ]
+                gens += [
+                    generate_azure_dicta(config, key, start_date, end_date, shared=gens[i % pool_size])
+                    for i in range(pool_size, max_gens)
+                ]
+            data[f"{key}_gens"] = gens
 
         return data
 
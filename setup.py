@@ -62,6 +62,7 @@ setup(
         "pyyaml>=5.3",
         "google-cloud-bigquery>=2.2.0",
     ],
+    extras_require={"zstd": ["zstandard>=0.15"]},
     dependency_links=[],
     entry_points={"console_scripts": ["nise = nise.__main__:main"]},
     include_package_data=True,
@@ -17,6 +17,7 @@
 from datetime import datetime
 from datetime import timedelta
 from unittest import TestCase
+from unittest.mock import patch
 
 from faker import Faker
 from nise.generators.aws import AWSGenerator
@@ -85,21 +86,27 @@ class AbstractGeneratorTestCase(TestCase):
         """Test that a valid list of hours are returned."""
         two_hours_ago = (self.now - self.one_hour) - self.one_hour
         generator = TestGenerator(two_hours_ago, self.now, self.payer_account, self.usage_accounts)
+        one_hour_ago = two_hours_ago + self.one_hour
+        stamps = [TestGenerator.timestamp(hour) for hour in (two_hours_ago, one_hour_ago, self.now)]
         expected = [
-            {"start": two_hours_ago, "end": two_hours_ago + self.one_hour},
-            {"start": two_hours_ago + self.one_hour, "end": two_hours_ago + self.one_hour + self.one_hour},
+            {"start": two_hours_ago, "end": one_hour_ago, "interval": f"{stamps[0]}/{stamps[1]}"},
+            {"start": one_hour_ago, "end": self.now, "interval": f"{stamps[1]}/{stamps[2]}"},
         ]
         self.assertEqual(generator.hours, expected)
 
-    def test_timestamp_none(self):
-        """Test that the timestamp method fails with None."""
-        with self.assertRaises(ValueError):
-            TestGenerator.timestamp(None)
+    def test_set_hours_intervals_across_days(self):
+        """Test that precomputed intervals match timestamp across a day boundary."""
+        start = datetime(2020, 1, 31, 22, 30)
+        generator = TestGenerator(start, start + 3 * self.one_hour, self.payer_account, self.usage_accounts)
+        for hour in generator.hours:
+            expected = TestGenerator.time_interval(hour.get("start"), hour.get("end"))
+            self.assertEqual(hour.get("interval"), expected)
+        self.assertEqual(generator.hours[1].get("interval"), "2020-01-31T23:30:00Z/2020-02-01T00:30:00Z")
 
-    def test_timestamp_invalid(self):
-        """Test that the timestamp method fails with an not a date."""
-        with self.assertRaises(ValueError):
-            TestGenerator.timestamp("invalid")
+    def test_timestamp(self):
+        """Test that the timestamp method returns an ISO 8601 UTC string."""
+        in_date = datetime(2020, 1, 2, 3, 4, 5)
+        self.assertEqual(TestGenerator.timestamp(in_date), "2020-01-02T03:04:05Z")
 
     def test_init_data_row(self):
         """Test the init data row method."""
@@ -110,33 +117,24 @@ class AbstractGeneratorTestCase(TestCase):
         for col in generator.AWS_COLUMNS:
             self.assertIsNotNone(a_row.get(col))
 
-    def test_init_data_row_start_none(self):
-        """Test the init data row method none start date."""
-        two_hours_ago = (self.now - self.one_hour) - self.one_hour
-        generator = TestGenerator(two_hours_ago, self.now, self.payer_account, self.usage_accounts)
-        with self.assertRaises(ValueError):
-            generator._init_data_row(None, self.now)
-
-    def test_init_data_row_end_none(self):
-        """Test the init data row method none end date."""
-        two_hours_ago = (self.now - self.one_hour) - self.one_hour
-        generator = TestGenerator(two_hours_ago, self.now, self.payer_account, self.usage_accounts)
-        with self.assertRaises(ValueError):
-            generator._init_data_row(two_hours_ago, None)
-
-    def test_init_data_row_start_invalid(self):
-        """Test the init data row method invalid start date."""
-        two_hours_ago = (self.now - self.one_hour) - self.one_hour
-        generator = TestGenerator(two_hours_ago, self.now, self.payer_account, self.usage_accounts)
-        with self.assertRaises(ValueError):
-            generator._init_data_row("invalid", self.now)
-
-    def test_init_data_row_end_invalid(self):
-        """Test the init data row method invalid end date."""
-        two_hours_ago = (self.now - self.one_hour) - self.one_hour
-        generator = TestGenerator(two_hours_ago, self.now, self.payer_account, self.usage_accounts)
-        with self.assertRaises(ValueError):
-            generator._init_data_row(two_hours_ago, "invalid")
+    def test_next_month(self):
+        """Test that next_month returns the first of the following month."""
+        self.assertEqual(TestGenerator.next_month(datetime(2020, 1, 31, 5)), datetime(2020, 2, 1, 5))
+        self.assertEqual(TestGenerator.next_month(datetime(2020, 12, 15)), datetime(2021, 1, 1))
+
+    def test_get_bill_period(self):
+        """Test that billing period bounds are formatted and cached per month."""
+        start = datetime(2020, 12, 15, 5)
+        generator = TestGenerator(start, start + self.one_hour, self.payer_account, self.usage_accounts)
+        expected = ("2020-12-01T00:00:00Z", "2021-01-01T00:00:00Z")
+        self.assertEqual(generator._get_bill_period(start), expected)
+        self.assertEqual(generator._bill_cache, {(2020, 12): expected})
+
+    def test_generate_product_sku(self):
+        """Test that product skus are 12 uppercase letters."""
+        sku = TestGenerator._generate_product_sku()
+        self.assertEqual(len(sku), 12)
+        self.assertTrue(sku.isalpha() and sku.isupper())
 
     def test_get_location(self):
         """Test the _get_location method."""
@@ -289,6 +287,17 @@ class TestDataTransferGenerator(AWSGeneratorTestCase):
         self.assertEqual(row["product/servicecode"], "AWSDataTransfer")
         self.assertEqual(row["product/productFamily"], "Data Transfer")
 
+    def test_update_data_with_location(self):
+        """Test that Data Transfer places the row in the location passed in."""
+        generator = DataTransferGenerator(
+            self.two_hours_ago, self.now, self.payer_account, self.usage_accounts, self.attributes
+        )
+        location = ("US West (N. California)", "us-west-1", "us-west-1a", "USW1-EBS")
+        row = generator._update_data({}, self.two_hours_ago, self.now, location=location)
+
+        self.assertEqual(row["product/location"], "US West (N. California)")
+        self.assertEqual(row["product/region"], "us-west-1")
+
 
 class TestEBSGenerator(AWSGeneratorTestCase):
     """Tests for the EBS Generator type."""
@@ -394,6 +403,16 @@ class TestRoute53Generator(AWSGeneratorTestCase):
         data = generator.generate_data()
         self.assertNotEqual(data, [])
 
+    def test_generate_data_without_locations(self):
+        """Test that Route53 rows are generated without drawing a location for each hour."""
+        generator = Route53Generator(
+            self.two_hours_ago, self.now, self.payer_account, self.usage_accounts, self.attributes
+        )
+        with patch.object(Route53Generator, "_get_location_options") as mock_options:
+            rows = list(generator.generate_data())
+        self.assertEqual(len(rows), 2)
+        mock_options.assert_not_called()
+
 
 class TestS3Generator(AWSGeneratorTestCase):
     """Tests for the S3 Generator type."""
@@ -416,6 +435,10 @@ class TestS3Generator(AWSGeneratorTestCase):
         self.assertEqual(row["product/servicecode"], "AmazonS3")
         self.assertEqual(row["lineItem/Operation"], "GetObject")
         self.assertEqual(row["lineItem/ProductCode"], "AmazonS3")
+        self.assertEqual(row["lineItem/UnblendedCost"], str(self.amount * self.rate))
+        self.assertEqual(row["lineItem/LineItemType"], "Usage")
+        self.assertEqual(row["lineItem/UsageStartDate"], self.two_hours_ago)
+        self.assertIn(row["lineItem/UsageAccountId"], self.usage_accounts)
 
     def test_generate_data(self):
         """Test that the S3 generate_data method works."""
@@ -423,6 +446,18 @@ class TestS3Generator(AWSGeneratorTestCase):
         data = generator.generate_data()
         self.assertNotEqual(data, [])
 
+    def test_generate_data_batched_picks(self):
+        """Test that batch sampled accounts and locations are applied to each row."""
+        self.attributes["region"] = "us-west-1a"
+        generator = S3Generator(self.two_hours_ago, self.now, self.payer_account, self.usage_accounts, self.attributes)
+        rows = list(generator.generate_data())
+        self.assertEqual(len(rows), 2)
+        for row in rows:
+            self.assertIn(row["lineItem/UsageAccountId"], self.usage_accounts)
+            self.assertEqual(row["product/region"], "us-west-1")
+            self.assertEqual(len(row["identity/LineItemId"]), 40)
+        self.assertNotEqual(rows[0]["identity/LineItemId"], rows[1]["identity/LineItemId"])
+
 
 class TestVPCGenerator(AWSGeneratorTestCase):
     """Tests for the VPC Generator type."""
@@ -18,38 +18,59 @@ import base64
 import calendar
 import csv
 import datetime
+import gzip
 import json
 import os
 import re
 import shutil
+import subprocess
+import tarfile
 from tempfile import mkdtemp
 from tempfile import NamedTemporaryFile
 from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest import skipUnless
 from unittest.mock import patch
 
 import faker
 from dateutil.relativedelta import relativedelta
 from nise.generators.ocp.ocp_generator import OCP_REPORT_TYPE_TO_COLS
+from nise.report import _aws_finalize_report
 from nise.report import _convert_bytes
 from nise.report import _create_month_list
 from nise.report import _generate_azure_filename
+from nise.report import _gzip_report
 from nise.report import _get_generators
 from nise.report import _get_jsonl_generators
+from nise.report import _process_months
 from nise.report import _remove_files
+from nise.report import _tar_gzip_report
 from nise.report import _write_csv
+from nise.report import _write_csv_gz
 from nise.report import _write_jsonl
 from nise.report import _write_manifest
+from nise.report import _write_report_files
+from nise.report import _zstd_report
 from nise.report import aws_create_report
 from nise.report import azure_create_report
+from nise.report import create_temporary_copy
 from nise.report import gcp_create_report
 from nise.report import gcp_route_file
 from nise.report import ocp_create_report
 from nise.report import ocp_route_file
 from nise.report import post_payload_to_ingest_service
+from nise.report import write_aws_file
+
+try:
+    import zstandard
+except ImportError:
+    # zstandard is an optional dependency, installed with the zstd extra.
+    zstandard = None
 
 
 fake = faker.Faker()
+SAMPLE_CSV_HEADERS = ["col1", "col2"]
+SAMPLE_CSV_DATA = [{"col1": "r1c1", "col2": "r1c2"}, {"col1": "r2c1", "col2": "r2c2"}]
 
 
 class MiscReportTestCase(TestCase):
@@ -68,6 +89,21 @@ class MiscReportTestCase(TestCase):
         result = _convert_bytes(petabyte_value)
         self.assertEqual(result, expected)
 
+    def test_create_temporary_copy(self):
+        """Test that the temporary copy is a hard link when possible."""
+        with NamedTemporaryFile(mode="w", delete=False) as source:
+            source.write("col1,col2\n")
+        temp_path = create_temporary_copy(source.name, "copy.csv", "nise-test-payload")
+        self.assertTrue(os.path.samefile(source.name, temp_path))
+
+        with patch("nise.report.os.link", side_effect=OSError("Invalid cross-device link")):
+            temp_path = create_temporary_copy(source.name, "copy.csv", "nise-test-payload")
+        self.assertFalse(os.path.samefile(source.name, temp_path))
+        with open(temp_path) as copied:
+            self.assertEqual(copied.read(), "col1,col2\n")
+        shutil.rmtree(os.path.dirname(temp_path))
+        os.remove(source.name)
+
     def test_write_csv(self):
         """Test the writing of the CSV data."""
         temp_file = NamedTemporaryFile(mode="w", delete=False)
@@ -77,6 +113,151 @@ class MiscReportTestCase(TestCase):
         self.assertTrue(os.path.exists(temp_file.name))
         os.remove(temp_file.name)
 
+    def test_write_csv_column_order_and_missing_values(self):
+        """Test that CSV rows follow the header order and fill missing columns."""
+        temp_file = NamedTemporaryFile(mode="w", delete=False)
+        headers = ["col2", "col1"]
+        data = [{"col1": "r1c1", "col2": "r1c2"}, {"col1": "r2c1"}]
+        _write_csv(temp_file.name, data, headers)
+        with open(temp_file.name) as f_in:
+            self.assertEqual(list(csv.reader(f_in)), [headers, ["r1c2", "r1c1"], ["", "r2c1"]])
+        _write_csv(temp_file.name, data[1:], ["col1"])
+        with open(temp_file.name) as f_in:
+            self.assertEqual(list(csv.reader(f_in)), [["col1"], ["r2c1"]])
+        os.remove(temp_file.name)
+
+    def test_write_csv_unknown_column(self):
+        """Test that a row with a column missing from the header fails like csv.DictWriter."""
+        temp_file = NamedTemporaryFile(mode="w", delete=False)
+        for headers, data in (
+            (["col1"], [{"col1": "r1c1", "col2": "r1c2"}]),
+            (["col1", "col2"], [{"col1": "r1c1", "col3": "r1c3"}]),
+            (["col1", "col2"], [{"col1": "r1c1", "col2": "r1c2", "col3": "r1c3"}]),
+        ):
+            with self.subTest(headers=headers, data=data):
+                with self.assertRaises(ValueError):
+                    _write_csv(temp_file.name, data, headers)
+        os.remove(temp_file.name)
+
+    def test_write_report_files(self):
+        """Test that rows are split into numbered files every row_limit rows."""
+
+        def write_file(file_number, rows):
+            return file_number, list(rows)
+
+        rows = [{"col": i} for i in range(5)]
+        self.assertEqual(_write_report_files(iter(rows), None, write_file), [(0, rows)])
+        self.assertEqual(_write_report_files(iter(rows), 10, write_file), [(0, rows)])
+        self.assertEqual(
+            _write_report_files(iter(rows), 2, write_file), [(1, rows[:2]), (2, rows[2:4]), (3, rows[4:])]
+        )
+        self.assertEqual(_write_report_files(iter(rows[:4]), 2, write_file), [(1, rows[:2]), (2, rows[2:4]), (3, [])])
+
+    def test_aws_finalize_report(self):
+        """Test that finalizing returns invoiced copies without touching the original rows."""
+        data = [{"bill/InvoiceId": "", "lineItem/UsageAmount": "1"}]
+        static_data = {"finalized_report": {"invoice_id": "123456789"}}
+        finalized = _aws_finalize_report(data, static_data)
+        self.assertEqual(finalized, [{"bill/InvoiceId": "123456789", "lineItem/UsageAmount": "1"}])
+        self.assertEqual(data[0]["bill/InvoiceId"], "")
+
+        invoice_id = _aws_finalize_report(data)[0]["bill/InvoiceId"]
+        self.assertEqual(len(invoice_id), 9)
+        self.assertTrue(invoice_id.isdigit())
+
+    def _write_sample_csv(self):
+        """Write a small CSV report that is removed after the test and return its path."""
+        temp_file = NamedTemporaryFile(mode="w", delete=False)
+        _write_csv(temp_file.name, SAMPLE_CSV_DATA, SAMPLE_CSV_HEADERS)
+        self.addCleanup(os.remove, temp_file.name)
+        return temp_file.name
+
+    def test_write_csv_gz(self):
+        """Test that the gzipped CSV matches the plain CSV output."""
+        csv_path = self._write_sample_csv()
+        gzip_path = f"{csv_path}.gz"
+        _write_csv_gz(gzip_path, SAMPLE_CSV_DATA, SAMPLE_CSV_HEADERS)
+        with open(csv_path, "rb") as f_in, gzip.open(gzip_path, "rb") as f_gz:
+            self.assertEqual(f_gz.read(), f_in.read())
+        os.remove(gzip_path)
+
+    def test_write_aws_file_compressed(self):
+        """Test that a compressed AWS report returns the path of the gzip file it wrote."""
+        file_name = write_aws_file(
+            0, "cur_report", "January", 2020, SAMPLE_CSV_DATA, None, None, SAMPLE_CSV_HEADERS, compress=True
+        )
+        self.assertTrue(file_name.endswith("January-2020-cur_report.csv.gz"))
+        with gzip.open(file_name, "rt") as f_gz:
+            self.assertEqual(next(csv.reader(f_gz)), SAMPLE_CSV_HEADERS)
+        self.assertFalse(os.path.exists(file_name[: -len(".gz")]))
+        os.remove(file_name)
+
+    def test_gzip_report(self):
+        """Test that the gzipped report decompresses to the original data with and without external tools."""
+        csv_path = self._write_sample_csv()
+        for which in (shutil.which, lambda _: None):
+            with self.subTest(which=which):
+                with patch("nise.report.shutil.which", side_effect=which):
+                    gzip_path = _gzip_report(csv_path)
+                with open(csv_path, "rb") as f_in, gzip.open(gzip_path, "rb") as f_gz:
+                    self.assertEqual(f_gz.read(), f_in.read())
+                os.remove(gzip_path)
+
+    def test_gzip_report_external_compressor_failure(self):
+        """Test that a failed external compressor leaves no partial gzip file behind."""
+        csv_path = self._write_sample_csv()
+        outputs = []
+
+        def failed_run(args, stdout, check):
+            outputs.append(stdout.name)
+            stdout.write(b"partial")
+            raise subprocess.CalledProcessError(1, args)
+
+        with patch("nise.report._find_gzip_command", return_value="pigz"):
+            with patch("nise.report.subprocess.run", side_effect=failed_run):
+                with self.assertRaises(subprocess.CalledProcessError):
+                    _gzip_report(csv_path)
+        self.assertEqual(len(outputs), 1)
+        self.assertFalse(os.path.exists(outputs[0]))
+
+    @patch("nise.report.shutil.which", return_value=None)
+    def test_gzip_report_without_external_compressor_chunks(self, _):
+        """Test the gzip module fallback with empty reports and reports spanning several chunks."""
+        for content in (b"", b"col1,col2\r\nr1c1,r1c2\r\n"):
+            with self.subTest(content=content), NamedTemporaryFile(mode="wb", delete=False) as temp_file:
+                temp_file.write(content)
+                temp_file.close()
+                with patch("nise.report.GZIP_CHUNK_SIZE", 4):
+                    gzip_path = _gzip_report(temp_file.name)
+                with gzip.open(gzip_path, "rb") as f_gz:
+                    self.assertEqual(f_gz.read(), content)
+                os.remove(temp_file.name)
+                os.remove(gzip_path)
+
+    @skipUnless(zstandard, "zstandard is not installed")
+    def test_zstd_report(self):
+        """Test that the zstd report decompresses to the original data."""
+        csv_path = self._write_sample_csv()
+        zstd_path = _zstd_report(csv_path)
+        self.assertTrue(zstd_path.endswith(".csv.zst"))
+        with open(csv_path, "rb") as f_in, open(zstd_path, "rb") as f_zst:
+            reader = zstandard.ZstdDecompressor().stream_reader(f_zst)
+            self.assertEqual(reader.read(), f_in.read())
+        os.remove(zstd_path)
+
+    def test_tar_gzip_report(self):
+        """Test that the tarball contains the directory contents with and without external tools."""
+        for which in (shutil.which, lambda _: None):
+            with self.subTest(which=which), TemporaryDirectory() as temp_dir:
+                with open(os.path.join(temp_dir, "manifest.json"), "w") as manifest:
+                    manifest.write("{}")
+                with patch("nise.report.shutil.which", side_effect=which):
+                    tar_path = _tar_gzip_report(temp_dir)
+                with tarfile.open(tar_path) as tar:
+                    names = [os.path.basename(name) for name in tar.getnames()]
+                    self.assertIn("manifest.json", names)
+                os.remove(tar_path)
+
     def test_write_jsonl(self):
         """Test the writing of the jsonl data."""
         temp_file = NamedTemporaryFile(mode="w", delete=False)
@@ -147,6 +328,17 @@ class MiscReportTestCase(TestCase):
             output = _create_month_list(test_case["start_date"], test_case["end_date"])
             self.assertCountEqual(output, test_case["expected_list"])
 
+    def test_create_month_list_same_month_across_years(self):
+        """Test that only the first and last months take the range boundaries."""
+        start_date = datetime.datetime(year=2018, month=1, day=15)
+        end_date = datetime.datetime(year=2019, month=1, day=5)
+        output = _create_month_list(start_date, end_date)
+        self.assertEqual(len(output), 13)
+        self.assertEqual(output[0]["start"], start_date)
+        self.assertEqual(output[0]["end"], datetime.datetime(year=2018, month=1, day=31, hour=23, minute=59))
+        self.assertEqual(output[-1]["start"], datetime.datetime(year=2019, month=1, day=1))
+        self.assertEqual(output[-1]["end"], datetime.datetime(year=2019, month=1, day=5, hour=23, minute=59))
+
     def test_get_generators(self):
         """Test the _get_generators helper function."""
         generators = _get_generators(None)
@@ -188,7 +380,7 @@ class MiscReportTestCase(TestCase):
         self.assertEqual(generators[0].get("attributes").get("end_date").year, 2019)
 
     @patch.dict(os.environ, {"INSIGHTS_ACCOUNT_ID": "12345", "INSIGHTS_ORG_ID": "54321"})
-    @patch("nise.report.requests.post")
+    @patch("nise.report._SESSION.post")
     def test_post_payload_to_ingest_service_with_identity_header(self, mock_post):
         """Test that the identity header path is taken."""
         insights_account_id = os.environ.get("INSIGHTS_ACCOUNT_ID")
@@ -215,7 +407,7 @@ class MiscReportTestCase(TestCase):
         self.assertNotIn("auth", mock_post.call_args[1])
 
     @patch.dict(os.environ, {"INSIGHTS_USER": "12345", "INSIGHTS_PASSWORD": "54321"})
-    @patch("nise.report.requests.post")
+    @patch("nise.report._SESSION.post")
     def test_post_payload_to_ingest_service_with_basic_auth(self, mock_post):
         """Test that the identity header path is taken."""
         insights_user = os.environ.get("INSIGHTS_USER")
@@ -233,6 +425,11 @@ class MiscReportTestCase(TestCase):
         post_payload_to_ingest_service(insights_upload, temp_file.name)
         self.assertEqual(mock_post.call_args[1].get("auth"), auth)
         self.assertNotIn("headers", mock_post.call_args[1])
+        self.assertFalse(mock_post.call_args[1].get("verify"))
+
+        with patch.dict(os.environ, {"INSIGHTS_VERIFY_SSL": "true"}):
+            post_payload_to_ingest_service(insights_upload, temp_file.name)
+        self.assertTrue(mock_post.call_args[1].get("verify"))
 
 
 class AWSReportTestCase(TestCase):
@@ -294,6 +491,129 @@ class AWSReportTestCase(TestCase):
         os.remove(expected_month_output_file)
         shutil.rmtree(local_bucket_path)
 
+    def test_aws_create_report_with_local_dir_without_write_monthly(self):
+        """Test that the aws report is streamed straight to gzip when no local copy is kept."""
+        now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        one_day = datetime.timedelta(days=1)
+        yesterday = now - one_day
+        local_bucket_path = mkdtemp()
+        options = {
+            "start_date": yesterday,
+            "end_date": now,
+            "aws_bucket_name": local_bucket_path,
+            "aws_report_name": "cur_report",
+        }
+        aws_create_report(options)
+        month_output_file_name = "{}-{}-{}".format(calendar.month_name[now.month], now.year, "cur_report")
+        expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+        self.assertFalse(os.path.isfile(expected_month_output_file))
+        self.assertFalse(os.path.isfile(f"{expected_month_output_file}.gz"))
+        uploaded = [name for _, _, files in os.walk(local_bucket_path) for name in files]
+        self.assertIn(f"{month_output_file_name}.csv.gz", uploaded)
+        shutil.rmtree(local_bucket_path)
+
+    @patch("nise.report.find_spec", return_value=None)
+    def test_aws_create_report_zstd_without_zstandard(self, _):
+        """Test that zstd compression without zstandard fails before any data is generated for a bucket."""
+        now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        options = {
+            "start_date": now - datetime.timedelta(days=1),
+            "end_date": now,
+            "aws_report_name": "cur_report",
+            "aws_compression": "zstd",
+        }
+        with patch("nise.report._process_months") as mock_process_months:
+            aws_create_report(options)
+            mock_process_months.assert_called_once()
+            mock_process_months.reset_mock()
+            with self.assertRaises(ImportError):
+                aws_create_report(dict(options, aws_bucket_name="bucket"))
+            mock_process_months.assert_not_called()
+
+    def test_process_months_single_worker(self):
+        """Test that months run in this process when only one worker could run."""
+        months = _create_month_list(datetime.datetime(2020, 1, 30), datetime.datetime(2020, 3, 2))
+        processed = []
+        with patch("nise.report.os.cpu_count", return_value=1), patch("nise.report.ProcessPoolExecutor") as mock_pool:
+            _process_months(lambda month, arg: processed.append((month.get("name"), arg)), months, "arg")
+        mock_pool.assert_not_called()
+        self.assertEqual(processed, [("January", "arg"), ("February", "arg"), ("March", "arg")])
+
+    def test_aws_create_report_across_months(self):
+        """Test that a range spanning months writes a report for each month."""
+        end_date = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+        start_date = end_date - datetime.timedelta(days=1)
+        local_bucket_path = mkdtemp()
+        options = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "aws_bucket_name": local_bucket_path,
+            "aws_report_name": "cur_report",
+            "write_monthly": True,
+        }
+        aws_create_report(options)
+        for month_date in (start_date, end_date):
+            month_output_file_name = "{}-{}-{}".format(
+                calendar.month_name[month_date.month], month_date.year, "cur_report"
+            )
+            expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+            self.assertTrue(os.path.isfile(expected_month_output_file))
+            os.remove(expected_month_output_file)
+        shutil.rmtree(local_bucket_path)
+
+    def test_aws_create_report_across_months_with_inactive_month(self):
+        """Test that a month without an active static generator still writes an empty report."""
+        local_bucket_path = mkdtemp()
+        static_aws_data = {
+            "generators": [{"EC2Generator": {"start_date": "2020-01-30", "end_date": "2020-01-31"}}],
+            "accounts": {"payer": 9999999999999, "user": [9999999999999]},
+        }
+        options = {
+            "start_date": datetime.datetime(2020, 1, 30),
+            "end_date": datetime.datetime(2020, 2, 2),
+            "aws_bucket_name": local_bucket_path,
+            "aws_report_name": "cur_report",
+            "static_report_data": static_aws_data,
+            "write_monthly": True,
+        }
+        aws_create_report(options)
+        for month in (1, 2):
+            month_output_file_name = "{}-{}-{}".format(calendar.month_name[month], 2020, "cur_report")
+            expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+            self.assertTrue(os.path.isfile(expected_month_output_file))
+            with open(expected_month_output_file) as month_file:
+                rows = list(csv.DictReader(month_file))
+            if month == 1:
+                self.assertTrue(rows)
+            else:
+                self.assertEqual(rows, [])
+            os.remove(expected_month_output_file)
+        shutil.rmtree(local_bucket_path)
+
+    @skipUnless(zstandard, "zstandard is not installed")
+    def test_aws_create_report_with_local_dir_zstd(self):
+        """Test the aws report creation method with local directory and zstd compression."""
+        now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        one_day = datetime.timedelta(days=1)
+        yesterday = now - one_day
+        local_bucket_path = mkdtemp()
+        options = {
+            "start_date": yesterday,
+            "end_date": now,
+            "aws_bucket_name": local_bucket_path,
+            "aws_report_name": "cur_report",
+            "aws_compression": "zstd",
+            "write_monthly": True,
+        }
+        aws_create_report(options)
+        month_output_file_name = "{}-{}-{}".format(calendar.month_name[now.month], now.year, "cur_report")
+        expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+        self.assertTrue(os.path.isfile(expected_month_output_file))
+        uploaded = [name for _, _, files in os.walk(local_bucket_path) for name in files]
+        self.assertIn(f"{month_output_file_name}.csv.zst", uploaded)
+        os.remove(expected_month_output_file)
+        shutil.rmtree(local_bucket_path)
+
     def test_aws_create_report_with_local_dir_report_prefix(self):
         """Test the aws report creation method with local directory and a report prefix."""
         now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
@@ -620,6 +940,54 @@ class OCPReportTestCase(TestCase):
             os.remove(expected_month_output_file)
         shutil.rmtree(local_insights_upload)
 
+    def test_ocp_create_report_across_months(self):
+        """Test that a range spanning months writes a report for each month."""
+        end_date = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+        start_date = end_date - datetime.timedelta(days=1)
+        local_insights_upload = mkdtemp()
+        cluster_id = "11112222"
+        options = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "insights_upload": local_insights_upload,
+            "ocp_cluster_id": cluster_id,
+            "write_monthly": True,
+        }
+        ocp_create_report(options)
+        for month_date in (start_date, end_date):
+            for report_type in OCP_REPORT_TYPE_TO_COLS.keys():
+                month_output_file_name = "{}-{}-{}-{}".format(
+                    calendar.month_name[month_date.month], month_date.year, cluster_id, report_type
+                )
+                expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+                self.assertTrue(os.path.isfile(expected_month_output_file))
+                os.remove(expected_month_output_file)
+        shutil.rmtree(local_insights_upload)
+
+    def test_ocp_create_report_across_months_with_inactive_month(self):
+        """Test that a month without an active static generator still writes each report type."""
+        local_insights_upload = mkdtemp()
+        cluster_id = "11112222"
+        static_ocp_data = {"generators": [{"OCPGenerator": {"start_date": "2020-01-30", "end_date": "2020-01-31"}}]}
+        options = {
+            "start_date": datetime.datetime(2020, 1, 30),
+            "end_date": datetime.datetime(2020, 2, 2),
+            "insights_upload": local_insights_upload,
+            "ocp_cluster_id": cluster_id,
+            "static_report_data": static_ocp_data,
+            "write_monthly": True,
+        }
+        ocp_create_report(options)
+        for month in (1, 2):
+            for report_type in OCP_REPORT_TYPE_TO_COLS.keys():
+                month_output_file_name = "{}-{}-{}-{}".format(
+                    calendar.month_name[month], 2020, cluster_id, report_type
+                )
+                expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+                self.assertTrue(os.path.isfile(expected_month_output_file))
+                os.remove(expected_month_output_file)
+        shutil.rmtree(local_insights_upload)
+
     def test_ocp_create_report_with_local_dir_static_generation(self):
         """Test the ocp report creation method with local directory and static generation."""
         now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
@@ -777,7 +1145,7 @@ class OCPReportTestCase(TestCase):
         shutil.rmtree(local_insights_upload)
 
     @patch.dict(os.environ, {"INSIGHTS_USER": "12345", "INSIGHTS_PASSWORD": "54321"})
-    @patch("nise.report.requests.post")
+    @patch("nise.report._SESSION.post")
     def test_ocp_route_file(self, mock_post):
         """Test that a response is good."""
         insights_user = os.environ.get("INSIGHTS_USER")
@@ -20,12 +20,12 @@ from unittest import TestCase
 from unittest.mock import Mock
 from unittest.mock import patch
 
-import boto3
 import faker
 from botocore.exceptions import ClientError
 from google.cloud.exceptions import GoogleCloudError
 from nise.upload import BlobServiceClient
 from nise.upload import gcp_bucket_to_dataset
+from nise.upload import S3_TRANSFER_CONFIG
 from nise.upload import upload_to_azure_container
 from nise.upload import upload_to_gcp_storage
 from nise.upload import upload_to_s3
@@ -39,7 +39,7 @@ class UploadTestCase(TestCase):
     TestCase class for upload
     """
 
-    @patch("boto3.resource")
+    @patch("boto3.session.Session.resource")
     def test_upload_to_s3_success(self, mock_boto_resource):
         """Test upload_to_s3 method with mock s3."""
         bucket_name = "my_bucket"
@@ -47,14 +47,17 @@ class UploadTestCase(TestCase):
         s3_client.Bucket.create.return_value = Mock()
         s3_client.Bucket.return_value.upload_file.return_value = Mock()
         mock_boto_resource.return_value = s3_client
-        s3_client = boto3.resource("s3")
+        s3_client = mock_boto_resource("s3")
         s3_client.Bucket(bucket_name).create()
         with NamedTemporaryFile(delete=False) as t_file:
             success = upload_to_s3(bucket_name, "/file.txt", t_file.name)
         self.assertTrue(success)
+        s3_client.Bucket.return_value.upload_file.assert_called_with(
+            t_file.name, "/file.txt", Config=S3_TRANSFER_CONFIG
+        )
         os.remove(t_file.name)
 
-    @patch("boto3.resource")
+    @patch("boto3.session.Session.resource")
     def test_upload_to_s3_failure(self, mock_boto_resource):
         """Test upload_to_s3 method with mock s3."""
         bucket_name = "my_bucket"
@@ -62,7 +65,7 @@ class UploadTestCase(TestCase):
         s3_client.Bucket.create.return_value = Mock()
         s3_client.Bucket.return_value.upload_file.side_effect = ClientError({"Error": {}}, "Create")
         mock_boto_resource.return_value = s3_client
-        s3_client = boto3.resource("s3")
+        s3_client = mock_boto_resource("s3")
         s3_client.Bucket(bucket_name).create()
         with NamedTemporaryFile(delete=False) as t_file:
             success = upload_to_s3(bucket_name, "/file.txt", t_file.name)
@@ -18,6 +18,8 @@ import os
 import shutil
 from importlib import import_module
 from unittest import TestCase
+from unittest.mock import patch
+from uuid import uuid4
 
 from nise.yaml_generators.azure import generator
 
@@ -114,3 +116,19 @@ class AzureGeneratorTestCase(TestCase):
             with self.subTest(random=boo):
                 data = self.yg.build_data(dc, boo)
                 validate_data(data, dc, check_func)
+
+    def test_build_data_instance_id_pool(self):
+        """Test that instance ids are only reused once there are more generators than the pool size."""
+        dc = self.yg.default_config()
+        pool_size = self.module.INSTANCE_ID_POOL_SIZE
+        dc.max_vmachine_gens = 3
+        dc.max_vnetwork_gens = pool_size + 8
+        with patch.object(self.module, "generate_instance_id", side_effect=lambda key, config: str(uuid4())):
+            data = self.yg.build_data(dc)
+        self.assertEqual(len({gen.instance_id for gen in data.vmachine_gens}), 3)
+        instance_ids = [gen.instance_id for gen in data.vnetwork_gens]
+        self.assertEqual(len(set(instance_ids)), pool_size)
+        self.assertEqual(instance_ids[pool_size:], instance_ids[:8])
+        for gen, shared in zip(data.vnetwork_gens[pool_size:], data.vnetwork_gens):
+            self.assertEqual(gen.resource_location, shared.resource_location)
+            self.assertEqual(gen.tags, shared.tags)